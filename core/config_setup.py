@@ -17,6 +17,8 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import configparser
+import io
+import threading
 from pathlib import Path
 import logging
 
@@ -31,6 +33,12 @@ class ConfigManager:
         self.config_dir = Path(config_dir)
         self.config_file_path = self.config_dir / config_file
 
+        # Serializes file writes; each snapshot gets a sequence number so an older
+        # background write never overwrites a newer one
+        self._write_lock = threading.Lock()
+        self._snapshot_seq = 0
+        self._written_seq = 0
+
         # Ensure the configuration directory exists
         try:
             self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -53,13 +61,40 @@ class ConfigManager:
     def save_config(self):
         # Save the current configuration to the file
         try:
-            with self.config_file_path.open('w') as configfile:
-                self.config.write(configfile)
+            self._write_snapshot(*self._snapshot())
             self.logger.info("Configuration saved successfully.")
         except IOError as e:
             self.logger.error(f"IOError while saving configuration: {e}")
             raise
 
+    def save_config_async(self):
+        # Snapshot the configuration now and write it to the file from a worker thread
+        if not hasattr(self, 'config'):
+            self.load_config()
+        threading.Thread(target=self._write_snapshot_logged, args=self._snapshot()).start()
+
+    def _snapshot(self):
+        # Serialize the in-memory configuration, returning its sequence number and text
+        buffer = io.StringIO()
+        self.config.write(buffer)
+        self._snapshot_seq += 1
+        return self._snapshot_seq, buffer.getvalue()
+
+    def _write_snapshot(self, seq, text):
+        # Write a serialized snapshot unless a newer one has already been written
+        with self._write_lock:
+            if seq < self._written_seq:
+                return
+            with self.config_file_path.open('w') as configfile:
+                configfile.write(text)
+            self._written_seq = seq
+
+    def _write_snapshot_logged(self, seq, text):
+        try:
+            self._write_snapshot(seq, text)
+        except IOError as e:
+            self.logger.error(f"IOError while saving configuration: {e}")
+
     def get_setting(self, section, option, default=None):
         # Get a configuration setting, returning a default value if the setting is not found
         if not hasattr(self, 'config'):
@@ -70,8 +105,8 @@ class ConfigManager:
             self.logger.error(f"Error getting setting '{option}' from section '{section}': {e}")
             return default
 
-    def set_setting(self, section, option, value):
-        # Set a configuration setting and save it to the file
+    def set_setting(self, section, option, value, save=True):
+        # Set a configuration setting and, unless save is False, save it to the file
         if not hasattr(self, 'config'):
             self.load_config()
 
@@ -79,7 +114,8 @@ class ConfigManager:
             if not self.config.has_section(section):
                 self.config.add_section(section)
             self.config.set(section, option, value)
-            self.save_config()
+            if save:
+                self.save_config()
         except configparser.Error as e:
             self.logger.error(f"Error setting '{option}' in section '{section}': {e}")
             raise
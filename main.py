@@ -144,6 +144,9 @@ class LinuxVitalsApp(Gtk.Application):
             
             # Make window reference available to widget factory for dialogs
             self.widget_factory.main_window = self.window
+
+            # Load the system CSS when the window is realized rather than at startup
+            self.css_manager.apply_on_realize(self.window)
             
             # Apply saved window size if enabled
             self.apply_saved_window_size()
@@ -350,9 +353,6 @@ class LinuxVitalsApp(Gtk.Application):
             # Add widgets to GUI components
             self.add_widgets_to_gui_components()
             
-            # Apply CSS styling
-            self.css_manager.apply_custom_styles()
-            
             # Initialize dark mode checkbutton state to match current theme
             self.settings_window.init_dark_mode_setting()
             
@@ -441,6 +441,20 @@ class CPUManager:
             self.logger.warning(f"Error reading file {file_path}: {e}")
             return None
 
+    def _read_int_safely(self, file_path: Optional[str]) -> Optional[int]:
+        """Read a sysfs integer with one raw read, parsing the bytes without decoding"""
+        if not file_path:
+            return None
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                buf = os.read(fd, 32)
+            finally:
+                os.close(fd)
+            return int(buf)  # int() accepts bytes and ignores the trailing newline
+        except (OSError, ValueError):
+            return None
+
     def _set_widget_sensitivity(self, widget: Optional[Any], sensitive: bool) -> None:
         """Set widget sensitivity safely"""
         if widget:
@@ -669,13 +683,9 @@ class CPUManager:
         # Read the current CPU speeds from the appropriate system files
         speeds = []  # List to store the CPU speeds
         for i in range(self.cpu_file_search.thread_count):
-            speed_file = self.cpu_file_search.cpu_files['speed_files'].get(i)
-            if speed_file and os.path.exists(speed_file):
-                with open(speed_file, 'r') as file:
-                    speed_str = file.read().strip()
-                    if speed_str:
-                        speed = int(speed_str) / CPUManagerConfig.KHZ_TO_MHZ_DIVISOR
-                        speeds.append((i, speed))
+            speed_khz = self._read_int_safely(self.cpu_file_search.cpu_files['speed_files'].get(i))
+            if speed_khz is not None:
+                speeds.append((i, speed_khz / CPUManagerConfig.KHZ_TO_MHZ_DIVISOR))
         return speeds
 
     def update_clock_labels(self, speeds):
@@ -698,7 +708,9 @@ class CPUManager:
                         unit = "MHz"
                         label.set_text(f"{display_speed:.0f} {unit}")
             else:
-                if i not in self.clock_labels:
+                # Tiles that are still being built at idle time are not missing
+                tiles_ready = self.monitor_tab_manager is None or self.monitor_tab_manager.tiles_ready
+                if i not in self.clock_labels and tiles_ready:
                     self.logger.warning(f"No clock label found for thread {i}")
         
         # Also handle threads that don't have speed data
@@ -878,11 +890,9 @@ class CPUManager:
                 # Intel specific throttle file check
                 for i in range(self.cpu_file_search.thread_count):
                     package_throttle_time_file = self.cpu_file_search.cpu_files.get('package_throttle_time_files', {}).get(i)
+                    current_throttle_time = self._read_int_safely(package_throttle_time_file)
 
-                    if package_throttle_time_file and os.path.exists(package_throttle_time_file):
-                        with open(package_throttle_time_file, 'r') as file:
-                            current_throttle_time = int(file.read().strip())
-
+                    if current_throttle_time is not None:
                         if self.prev_package_throttle_time[i] is not None:
                             if current_throttle_time > self.prev_package_throttle_time[i]:
                                 self.is_throttling = True  # Set throttling flag if throttle time has increased
@@ -32,6 +32,13 @@ class DiskInfo:
         self.model = model or "Unknown"
         self.size = size or "Unknown"
 
+        # Static display text, built once since model and size never change
+        title = f"{device_name} ({self.model})"
+        if len(title) > 40:  # Truncate if too long
+            title = title[:37] + "..."
+        self.display_title = title
+        self.details_prefix = f"Size: {self.size} | "
+
         # I/O statistics
         self.read_bytes_per_sec = 0.0
         self.write_bytes_per_sec = 0.0
@@ -627,7 +634,7 @@ class DiskManager:
 
                     # Use markup to color the Read/Write words
                     details_markup = (
-                        f"Size: {disk_info.size} | "
+                        f"{disk_info.details_prefix}"
                         f"<span foreground='{colors['read']}'>Read</span>: {read_speed_str} | "
                         f"<span foreground='{colors['write']}'>Write</span>: {write_speed_str}"
                     )
@@ -90,6 +90,18 @@ class MemoryManager:
             self.logger.error(f"Error reading memory info: {e}")
             return {}
 
+    def get_swap_total(self) -> Optional[int]:
+        """Read the total swap size in bytes from /proc/meminfo, or None if it cannot be read"""
+        try:
+            with open('/proc/meminfo', 'r') as file:
+                for line in file:
+                    if line.startswith('SwapTotal:'):
+                        return int(line.split()[1]) * 1024
+            return 0
+        except Exception as e:
+            self.logger.error(f"Error reading swap total: {e}")
+            return None
+
     def update_memory_info(self):
         """Update memory information and history"""
         try:
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+
+# LinuxVitals - System Monitoring and Control Application for Linux
+# Copyright (c) 2024 Noel Ejemyr <noelejemyr@protonmail.com>
+#
+# LinuxVitals is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LinuxVitals is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+# Shared GObject introspection setup for the UI modules.
+# The typelib versions are pinned once here and the modules import from this file.
+
+import gi
+gi.require_version('Gtk', '4.0')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Pango', '1.0')
+gi.require_version('GdkPixbuf', '2.0')
+from gi.repository import Gtk, Gdk, GLib, Gio, Pango, GdkPixbuf
+
+__all__ = ['Gtk', 'Gdk', 'GLib', 'Gio', 'Pango', 'GdkPixbuf']
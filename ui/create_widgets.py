@@ -19,7 +19,42 @@
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Gdk', '4.0')
-from gi.repository import Gtk, GLib, Gdk
+from gi.repository import Gtk, GLib, Gdk, GObject
+import sys
+
+# CSS class names applied by the factory, interned once at module load
+_CSS_NOTEBOOK = sys.intern('notebook')
+_CSS_TAB_LABEL = sys.intern('tab-label')
+_CSS_SETTINGS_TAB_LABEL = sys.intern('settings-tab-label')
+_CSS_ABOUT_TAB_LABEL = sys.intern('about-tab-label')
+_CSS_BUTTON = sys.intern('button')
+_CSS_INFOBUTTON = sys.intern('infobutton')
+
+# Frequently used Gtk enum values, resolved once instead of per widget
+_VERT = Gtk.Orientation.VERTICAL
+_HORIZ = Gtk.Orientation.HORIZONTAL
+_START = Gtk.Align.START
+_CENTER = Gtk.Align.CENTER
+_AUTO = Gtk.PolicyType.AUTOMATIC
+
+# Container types that take a single child via set_child
+_SET_CHILD_TYPES = frozenset({Gtk.ApplicationWindow, Gtk.Popover, Gtk.Window})
+
+class _ResizeAwareScale(Gtk.Scale):
+    # Gtk.Scale that reports width changes, since GTK4 has no size-allocate signal
+    __gsignals__ = {
+        'resized': (GObject.SignalFlags.RUN_LAST, None, (int,)),
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._allocated_width = 0
+
+    def do_size_allocate(self, width, height, baseline):
+        Gtk.Scale.do_size_allocate(self, width, height, baseline)
+        if width != self._allocated_width:
+            self._allocated_width = width
+            self.emit('resized', width)
 
 class WidgetFactory:
     def __init__(self, logger, global_state):
@@ -27,7 +62,11 @@ class WidgetFactory:
         self.logger = logger
         self.global_state = global_state
 
-        self.scales = []  # Store references to created scales
+        # Store references to created scales as parallel lists
+        self._scales = []
+        self._labels = []
+        self._freq_ids = set()  # Indices of frequency scales
+        self._reposition_pending = False  # Whether a label reposition pass is already queued
 
     def create_window(self, title, transient_for=None, default_width=100, default_height=100):
         # Create a new Gtk.Window
@@ -46,7 +85,7 @@ class WidgetFactory:
     def create_box(self, container, x=0, y=0, **kwargs):
         # Create a new Gtk.Box widget with vertical orientation and add it to the container
         try:
-            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+            box = Gtk.Box(orientation=_VERT)
             if 'spacing' in kwargs:
                 box.set_spacing(kwargs['spacing'])
             if 'hexpand' in kwargs:
@@ -76,7 +115,7 @@ class WidgetFactory:
         try:
             notebook = Gtk.Notebook()
             parent.append(notebook)
-            notebook.add_css_class('notebook')
+            notebook.add_css_class(_CSS_NOTEBOOK)
             return notebook
         except Exception as e:
             self.logger.error("Failed to create notebook: %s", e)
@@ -86,12 +125,12 @@ class WidgetFactory:
         # Create a new tab for the Gtk.Notebook widget
         try:
             scrolled_window = Gtk.ScrolledWindow()
-            scrolled_window.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
+            scrolled_window.set_policy(_AUTO, _AUTO)
             scrolled_window.set_hexpand(True)
             scrolled_window.set_vexpand(True)
 
             tab = Gtk.Box()
-            tab.set_orientation(Gtk.Orientation.VERTICAL)
+            tab.set_orientation(_VERT)
             tab.set_margin_start(10)
             tab.set_margin_end(10)
             tab.set_margin_top(10)
@@ -100,7 +139,7 @@ class WidgetFactory:
 
             tab_label = Gtk.Label(label=tab_name)
             tab_label.set_angle(0)  # Ensure text is horizontal
-            tab_label.add_css_class('tab-label')
+            tab_label.add_css_class(_CSS_TAB_LABEL)
             notebook.append_page(scrolled_window, tab_label)
             return tab
         except Exception as e:
@@ -111,9 +150,9 @@ class WidgetFactory:
         # Create a new settings tab for the Gtk.Notebook widget
         try:
             settings_tab = Gtk.Box()
-            settings_tab.set_orientation(Gtk.Orientation.VERTICAL)
+            settings_tab.set_orientation(_VERT)
             settings_tab_label = Gtk.Label(label=settings_tab_name)
-            settings_tab_label.add_css_class('settings-tab-label')
+            settings_tab_label.add_css_class(_CSS_SETTINGS_TAB_LABEL)
             notebook.append_page(settings_tab, settings_tab_label)
             return settings_tab
         except Exception as e:
@@ -124,9 +163,9 @@ class WidgetFactory:
         # Create a new about tab for the Gtk.Notebook widget
         try:
             about_tab = Gtk.Box()
-            about_tab.set_orientation(Gtk.Orientation.VERTICAL)
+            about_tab.set_orientation(_VERT)
             about_tab_label = Gtk.Label(label=about_tab_name)
-            about_tab_label.add_css_class('about-tab-label')
+            about_tab_label.add_css_class(_CSS_ABOUT_TAB_LABEL)
             notebook.append_page(about_tab, about_tab_label)
             return about_tab
         except Exception as e:
@@ -169,7 +208,7 @@ class WidgetFactory:
         # Create a new Gtk.Scale widget and add it to the container
         try:
             adjustment = Gtk.Adjustment(lower=from_value, upper=to_value, step_increment=1)
-            scale = Gtk.Scale(orientation=Gtk.Orientation.HORIZONTAL, adjustment=adjustment)
+            scale = _ResizeAwareScale(orientation=_HORIZ, adjustment=adjustment)
             scale.set_draw_value(False)  # Don't draw the built-in value
 
             overlay = Gtk.Overlay()
@@ -178,7 +217,10 @@ class WidgetFactory:
             overlay.set_child(scale)
             overlay.add_overlay(label)
 
-            def update_label(scale, label):
+            # Cached scale width, refreshed whenever the scale is resized
+            scale._w = 0
+
+            def on_scale_value_changed(scale):
                 value = scale.get_value()
                 if Frequency:
                     if self.global_state.display_ghz:
@@ -194,25 +236,27 @@ class WidgetFactory:
                     label.set_text(str(int(display_value)))
                 self._update_scale_label_position(scale, label)
 
-            def on_scale_value_changed(scale):
-                update_label(scale, label)
-
             if command:
                 scale.connect("value-changed", command)
-            scale.connect("value-changed", lambda s: on_scale_value_changed(s))
+            scale.connect("value-changed", on_scale_value_changed)
+            # Window resizes change the scale width, so reposition the labels in one idle pass
+            scale.connect("resized", lambda *_: self.update_all_scale_labels())
             on_scale_value_changed(scale)
 
-            label.set_halign(Gtk.Align.START)
-            label.set_valign(Gtk.Align.CENTER)
+            label.set_halign(_START)
+            label.set_valign(_CENTER)
 
             self._set_margins(overlay, **kwargs)
             self._attach_widget(container, overlay, x, y)
 
             # To manage visibility of both scale and label
-            scale.connect("notify::visible", lambda scale, param: overlay.set_visible(scale.get_visible()))
+            scale.bind_property("visible", overlay, "visible", GObject.BindingFlags.SYNC_CREATE)
 
             # Store references to the scale and label for later updates
-            self.scales.append((scale, label, Frequency))
+            if Frequency:
+                self._freq_ids.add(len(self._scales))
+            self._scales.append(scale)
+            self._labels.append(label)
 
             return scale
         except Exception as e:
@@ -220,18 +264,33 @@ class WidgetFactory:
             return None
 
     def update_all_scale_labels(self):
-        # Update the position of all scale labels
-        for scale, label, is_frequency in self.scales:
+        # Queue a single idle pass that repositions all scale labels
+        if self._reposition_pending:
+            return
+        self._reposition_pending = True
+        GLib.idle_add(self._flush_reposition)
+
+    def _flush_reposition(self):
+        # Reposition every scale label in one batch, then remove the idle source
+        self._reposition_pending = False
+        for scale, label in zip(self._scales, self._labels):
+            scale._w = scale.get_allocated_width()
             self._update_scale_label_position(scale, label)
+        return False
 
     def _update_scale_label_position(self, scale, label):
         try:
+            # Use the cached scale width; only query GTK until the scale has been allocated
+            if not scale._w:
+                scale._w = scale.get_allocated_width()
+            scale_width = scale._w
+            # The label width changes with every set_text, so measure its natural width now
+            label_width = label.measure(_HORIZ, -1)[1]
+
             adjustment = scale.get_adjustment()
-            scale_width = scale.get_allocated_width()
             handle_position = (scale.get_value() - adjustment.get_lower()) / (adjustment.get_upper() - adjustment.get_lower())
             handle_x = scale_width * handle_position
 
-            label_width = label.get_allocated_width()
             label_x = handle_x - (label_width / 2)
             label_x = max(min(label_x, scale_width - label_width), 0)
 
@@ -242,18 +301,21 @@ class WidgetFactory:
 
     def update_frequency_scale_labels(self):
         # Update the labels for all frequency scales
-        for scale, label, is_frequency in self.scales:
-            if is_frequency:  # Only update if it is a frequency scale
-                try:
-                    value = scale.get_value()
-                    if self.global_state.display_ghz:
-                        display_value = value / 1000.0
-                        label.set_text(f"{display_value:.2f} GHz")
-                    else:
-                        label.set_text(f"{value:.0f} MHz")
-                    self._update_scale_label_position(scale, label)
-                except Exception as e:
-                    self.logger.error(f"Error updating label for scale: {e}")
+        for index in self._freq_ids:
+            scale = self._scales[index]
+            label = self._labels[index]
+            try:
+                value = scale.get_value()
+                if self.global_state.display_ghz:
+                    display_value = value / 1000.0
+                    label.set_text(f"{display_value:.2f} GHz")
+                else:
+                    label.set_text(f"{value:.0f} MHz")
+                self._update_scale_label_position(scale, label)
+            except Exception as e:
+                self.logger.error(f"Error updating label for scale: {e}")
+        # Refresh the cached scale widths after relayout
+        self.update_all_scale_labels()
 
     def create_button(self, container, text, command=None, x=0, y=0, **kwargs):
         # Create a new Gtk.Button widget and add it to the container
@@ -264,7 +326,7 @@ class WidgetFactory:
             # Use a label widget for the text inside the button
             label = Gtk.Label(label=text)
             button.set_child(label)
-            button.add_css_class('button')
+            button.add_css_class(_CSS_BUTTON)
 
             self._set_margins(button, **kwargs)
             self._attach_widget(container, button, x, y)
@@ -282,7 +344,7 @@ class WidgetFactory:
             # Create an image with the icon name
             info_icon = Gtk.Image.new_from_icon_name("dialog-information")
             button.set_child(info_icon)
-            button.add_css_class('infobutton')
+            button.add_css_class(_CSS_INFOBUTTON)
 
             self._set_margins(button, **kwargs)
             self._attach_widget(container, button, x, y)
@@ -311,9 +373,7 @@ class WidgetFactory:
 
     def create_dropdown(self, container, values, command, x=0, y=0, **kwargs):
         try:
-            store = Gtk.StringList()
-            for val in values:
-                store.append(val)
+            store = Gtk.StringList.new(list(values))
             dropdown = Gtk.DropDown.new(store, None)
             
             # Change the signal connection
@@ -370,7 +430,7 @@ class WidgetFactory:
                 container.append(widget)
             elif isinstance(container, Gtk.Fixed):
                 container.put(widget, x, y)
-            elif isinstance(container, (Gtk.ApplicationWindow, Gtk.Popover, Gtk.Window)):
+            elif type(container) in _SET_CHILD_TYPES:
                 container.set_child(widget)
             elif isinstance(container, Gtk.Frame):
                 if hasattr(container, 'get_child') and container.get_child() is None:
@@ -513,7 +573,7 @@ class WidgetFactory:
     def create_horizontal_box(self, **kwargs):
         # Create a new horizontal Gtk.Box
         try:
-            box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
+            box = Gtk.Box(orientation=_HORIZ)
             if 'spacing' in kwargs:
                 box.set_spacing(kwargs['spacing'])
             if 'hexpand' in kwargs:
@@ -531,7 +591,7 @@ class WidgetFactory:
     def create_vertical_box(self, **kwargs):
         # Create a new vertical Gtk.Box
         try:
-            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+            box = Gtk.Box(orientation=_VERT)
             if 'spacing' in kwargs:
                 box.set_spacing(kwargs['spacing'])
             if 'hexpand' in kwargs:
@@ -575,7 +635,7 @@ class WidgetFactory:
             self.logger.error(f"Failed to create adjustment: {e}")
             return None
 
-    def create_scale_widget(self, orientation=Gtk.Orientation.HORIZONTAL, adjustment=None, **kwargs):
+    def create_scale_widget(self, orientation=_HORIZ, adjustment=None, **kwargs):
         # Create a new Gtk.Scale widget (different from the overlay scale in create_scale)
         try:
             if adjustment:
@@ -592,10 +652,7 @@ class WidgetFactory:
     def create_string_list(self, items=None, **kwargs):
         # Create a new Gtk.StringList
         try:
-            string_list = Gtk.StringList()
-            if items:
-                for item in items:
-                    string_list.append(item)
+            string_list = Gtk.StringList.new(list(items) if items else None)
             return string_list
         except Exception as e:
             self.logger.error(f"Failed to create string list: {e}")
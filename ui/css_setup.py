@@ -17,164 +17,35 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import os
-import gi
-gi.require_version('Gtk', '4.0')
-from gi.repository import Gtk, Gdk
+import re
+from ui._gi_bootstrap import Gtk, Gdk, GLib
+
+_STYLE_CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "style.css")
+
+# GTK 4.12+ can load a stylesheet straight from a GBytes without copying it
+_HAS_LOAD_FROM_BYTES = hasattr(Gtk.CssProvider, 'load_from_bytes')
+_HAS_LOAD_FROM_STRING = hasattr(Gtk.CssProvider, 'load_from_string')
+
+def _minify_css(css):
+    # Strip comments and redundant whitespace so GTK has less to tokenize
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,])\s*', r'\1', css)
+    # A space before ':' can be a descendant combinator ('box :hover'), so only trim after it
+    css = re.sub(r':\s+', ':', css)
+    return css.strip()
+
+def _load_css_file(path):
+    # Read and minify a stylesheet shipped next to this module
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return _minify_css(f.read()).encode('utf-8')
+    except OSError:
+        return b''
 
 class CssManager:
-    # Default system CSS to ensure consistent look
-    CSS_SYSTEM = """
-        * {
-            font-family: 'System-ui';
-            font-size: 10pt;
-        }
-
-        notebook tab:hover,
-        notebook tab:active, 
-        notebook tab:checked {
-            border-radius: 4px;
-        }
-
-        .tab-label {
-            font-size: 13pt;
-            padding: 5px 85px;
-        }
-
-        .settings-tab-label {
-            font-size: 11pt;
-            padding: 5px 7px;
-        }
-
-        .about-tab-label {
-            font-size: 11pt;
-            padding: 5px 70px;
-        }
-
-        scrollbar slider {
-            border-radius: 8px;
-        }
-
-        menuitem {
-            padding: 8px 12px;
-            border-radius: 4px;
-        }
-
-        menuitem:hover * {
-            border-radius: 4px;
-        }
-
-        label {
-            padding: 2px;
-        }
-
-        entry {
-            padding: 4px;
-            border-radius: 4px;
-        }
-
-        scale {
-            min-width: 185px;
-        }
-
-        scale slider {
-            border-radius: 1000px;
-        }
-
-        .button {
-            padding: 2px 15px;
-            border-radius: 4px;
-        }
-
-        .infobutton {
-            min-height: 20px;
-            min-width: 20px;
-            padding: 2px 2px;
-            border-radius: 4px;
-        }
-        checkbutton {
-            padding: 2px;
-            border-radius: 4px;
-        }
-
-        checkbutton label:hover {
-            color: grey;
-        }
-
-        dropdown * {
-            border-radius: 8px;
-        }
-
-        .small-header {
-            font-weight: bold;
-            font-size: 12px;
-        }
-
-        .medium-header {
-            font-weight: bold;
-            font-size: 14px;
-        }
-
-        .thick-header {
-            font-weight: bold;
-            font-size: 16px;
-        }
-
-        .small-label
-        .package_temp_label {
-            font-size: 12px;
-        }
-
-        .medium-label{
-            font-size: 14px;
-        }
-
-        .thick-label{
-            font-size: 16px;
-        }
-
-        /* Navigation Sidebar Styles */
-        .sidebar {
-            background-color: @theme_base_color;
-            border-right: 1px solid @borders;
-        }
-        
-        .navigation-sidebar {
-            background-color: transparent;
-            border: none;
-        }
-        
-        .navigation-sidebar row {
-            border-radius: 6px;
-            margin: 2px 8px;
-            padding: 4px;
-            min-height: 40px;
-        }
-        
-        .navigation-sidebar row:selected {
-            background-color: @theme_selected_bg_color;
-            color: @theme_selected_fg_color;
-        }
-        
-        .navigation-sidebar row:hover:not(:selected) {
-            background-color: alpha(@theme_fg_color, 0.1);
-        }
-        
-        .navigation-sidebar row box {
-            padding: 4px 8px;
-        }
-        
-        .navigation-sidebar image {
-            color: @theme_fg_color;
-        }
-        
-
-        /* Sidebar header styling */
-        .sidebar .heading {
-            font-weight: bold;
-            font-size: 16px;
-            color: @theme_fg_color;
-        }
-    """
+    # Default system CSS to ensure consistent look, minified and encoded once at load
+    CSS_SYSTEM_BYTES = _load_css_file(_STYLE_CSS_PATH)
 
     def __init__(self, config_manager, logger, widget_factory=None):
         # References to instances
@@ -188,22 +59,67 @@ class CssManager:
         else:
             self.css_provider = Gtk.CssProvider()
 
-        # Apply the default system CSS on startup
-        self.apply_css(self.CSS_SYSTEM)
+        # The provider only needs to be registered with the display once
+        self._display = Gdk.Display.get_default()
+        self._provider_registered = False
+
+        # Idle source id of a queued apply_custom_styles, 0 when none is pending
+        self._apply_pending = 0
+
+        # The default system CSS is applied when the main window is realized, see apply_on_realize
+        if not self.CSS_SYSTEM_BYTES:
+            self.logger.warning(f"System stylesheet not found or unreadable: {_STYLE_CSS_PATH}")
 
     def apply_css(self, css_data):
-        # Apply the provided CSS data to the application
-        self.css_provider.load_from_data(css_data.encode())
-        Gtk.StyleContext.add_provider_for_display(
-            Gdk.Display.get_default(),
-            self.css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        # Apply the provided CSS data (str or pre-encoded bytes) to the application
+        if _HAS_LOAD_FROM_STRING and isinstance(css_data, str):
+            self.css_provider.load_from_string(css_data)
+        else:
+            if not isinstance(css_data, bytes):
+                css_data = css_data.encode('utf-8')
+            self._load_css_bytes(css_data)
+
+        # Reloading the data is picked up automatically once the provider is registered
+        if not self._provider_registered:
+            if self._display is None:
+                self._display = Gdk.Display.get_default()
+            Gtk.StyleContext.add_provider_for_display(
+                self._display,
+                self.css_provider,
+                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
+            self._provider_registered = True
+
+    def _load_css_bytes(self, css_data):
+        # Load encoded CSS through the cheapest API this GTK version offers
+        if _HAS_LOAD_FROM_BYTES:
+            self.css_provider.load_from_bytes(GLib.Bytes.new(css_data))
+        else:
+            self.css_provider.load_from_data(css_data)
+
+    def apply_on_realize(self, window):
+        # Apply the system CSS once the window is realized, before its first frame
+        window.connect("realize", self._on_window_realize)
+
+    def _on_window_realize(self, window):
+        # Run the load now and drop any queued idle apply it would duplicate
+        window.disconnect_by_func(self._on_window_realize)
+        if self._apply_pending:
+            GLib.source_remove(self._apply_pending)
+        self._do_apply_css()
 
     def apply_custom_styles(self):
+        # Queue the system CSS load so bursts of requests collapse into one parse
+        if self._apply_pending:
+            return
+        self._apply_pending = GLib.idle_add(self._do_apply_css, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _do_apply_css(self):
         # Apply basic system CSS while respecting system theme
+        self._apply_pending = 0
         try:
             self.logger.info("Applying system CSS")
-            self.apply_css(self.CSS_SYSTEM)
+            self.apply_css(self.CSS_SYSTEM_BYTES)
         except Exception as e:
             self.logger.error(f"Error applying CSS: {e}")
+        return False
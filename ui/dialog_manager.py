@@ -16,87 +16,147 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-import gi
-gi.require_version('Gtk', '4.0')
-from gi.repository import Gtk
+import os
+from ui._gi_bootstrap import Gtk, Gdk, GLib, Pango
+
+_ABOUT_MARKUP = (
+    "<b>LinuxVitals</b>\n\n"
+    "CPU Monitoring and Control Application for Linux\n\n"
+    "Version 1.0"
+)
+
+# Links are handled by Gtk.Label itself, so this one is kept as markup
+_CREDITS_MARKUP = (
+    "Main developer: Noel Ejemyr\n\n"
+    "This application is licensed under the <a href='https://www.gnu.org/licenses/gpl-3.0.html'>GNU General Public License v3</a>.\n\n"
+    "This application uses <a href='https://www.gtk.org/'>GTK</a> for its graphical interface.\n\n"
+    "This application uses <a href='https://github.com/leogx9r/ryzen_smu'>ryzen_smu</a> for controlling Ryzen CPUs."
+)
+
+_ABOUT_UI_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "about.ui")
+
+# Parse the about markup once at import time
+try:
+    _, _ABOUT_ATTRS, _ABOUT_TEXT, _ = Pango.parse_markup(_ABOUT_MARKUP, -1, '\0')
+except GLib.Error:
+    _ABOUT_ATTRS = _ABOUT_TEXT = None
+
+# Gtk.Label.set_tabs is only available on GTK 4.8 and newer
+_HAS_LABEL_TABS = hasattr(Gtk.Label, 'set_tabs')
+
+def _destroy_on_response(dialog, response):
+    """Destroy a dialog once it has been answered"""
+    dialog.destroy()
+
+def _confirm_on_response(dialog, response, on_confirm):
+    """Run the confirmation callback on YES, then destroy the dialog"""
+    if response == Gtk.ResponseType.YES:
+        on_confirm()
+    dialog.destroy()
 
 class DialogManager:
     """Manages all dialog creation and display"""
+
+    # (label, mount_info key) pairs shown in the mount properties dialog
+    _MOUNT_PROP_ROWS = (
+        ("Device", "device"),
+        ("Mount Point", "mountpoint"),
+        ("Filesystem", "fstype"),
+        ("Options", "options"),
+        ("Total Size", "total_size"),
+        ("Used Space", "used_space"),
+        ("Free Space", "free_space"),
+        ("Usage", "usage_percent"),
+    )
     
     def __init__(self, logger, widget_factory, icon_path=None):
         self.logger = logger
         self.widget_factory = widget_factory
         self.icon_path = icon_path
+
+        # Decode the application icon once instead of on every about dialog build
+        self._icon_texture = None
+        if icon_path:
+            try:
+                self._icon_texture = Gdk.Texture.new_from_filename(icon_path)
+            except Exception as e:
+                self.logger.warning(f"Failed to load application icon: {e}")
+
+        # Read the about dialog layout once; it is instantiated with Gtk.Builder
+        self._about_ui = None
+        try:
+            with open(_ABOUT_UI_PATH, 'r', encoding='utf-8') as f:
+                self._about_ui = f.read()
+        except OSError as e:
+            self.logger.error(f"Failed to read about dialog layout: {e}")
+
+        # Built on first use and reused afterwards
+        self._about_window = None
+        self._more_popovers = {}
     
     def show_about_dialog(self, parent_window=None):
         """Show the about dialog with application information"""
         try:
-            # Create about window
-            about_window = self.widget_factory.create_window("About", parent_window, 350, 205)
-            
-            def on_destroy(widget):
-                about_window.close()
-            
-            about_window.connect("close-request", on_destroy)
-            
-            # Create content
-            about_box = self.widget_factory.create_box(about_window)
-            about_notebook = self.widget_factory.create_notebook(about_box)
+            # Reuse the already built about window
+            if self._about_window is not None:
+                self._about_window.set_transient_for(parent_window)
+                self._about_window.present()
+                return
+
+            # Build the about window from the cached layout description
+            builder = Gtk.Builder.new_from_string(self._about_ui, -1)
+            about_window = builder.get_object("about_window")
+            about_window.set_transient_for(parent_window)
+            about_window.connect("close-request", self._on_about_close_request)
+            about_window.connect("destroy", self._on_about_destroy)
             
             # About Tab
-            self._create_about_tab(about_notebook)
+            self._populate_about_tab(builder)
             
             # Credits Tab
-            self._create_credits_tab(about_notebook)
+            self._populate_credits_tab(builder)
             
+            self._about_window = about_window
             about_window.present()
             
         except Exception as e:
             self.logger.error(f"Error showing about dialog: {e}")
+
+    def _on_about_close_request(self, window):
+        """Hide the about window instead of destroying it so it can be reused"""
+        window.set_visible(False)
+        return True
+
+    def _on_about_destroy(self, window):
+        """Drop the cached about window once it has been destroyed"""
+        self._about_window = None
     
-    def _create_about_tab(self, notebook):
-        """Create the About tab content"""
+    def _populate_about_tab(self, builder):
+        """Fill in the About tab content"""
         try:
-            about_tab = self.widget_factory.create_about_tab(notebook, "About")
-            about_grid = self.widget_factory.create_grid()
-            about_fixed = self.widget_factory.create_fixed()
-            about_tab.append(about_grid)
-            about_grid.attach(about_fixed, 0, 0, 1, 1)
-            
             # Application icon
-            if self.icon_path:
-                icon = self.widget_factory.create_image(file_path=self.icon_path)
-                icon.set_size_request(128, 128)
-                about_fixed.put(icon, 0, 10)
+            icon = builder.get_object("about_icon")
+            if self._icon_texture:
+                icon.set_from_paintable(self._icon_texture)
+            else:
+                icon.set_visible(False)
             
             # Application info
-            self.widget_factory.create_label(
-                about_fixed,
-                markup="<b>LinuxVitals</b>\n\n"
-                       "CPU Monitoring and Control Application for Linux\n\n"
-                       "Version 1.0",
-                x=120, y=30)
+            about_label = builder.get_object("about_label")
+            if _ABOUT_ATTRS is not None:
+                about_label.set_text(_ABOUT_TEXT)
+                about_label.set_attributes(_ABOUT_ATTRS)
+            else:
+                about_label.set_markup(_ABOUT_MARKUP)
                 
         except Exception as e:
             self.logger.error(f"Error creating about tab: {e}")
     
-    def _create_credits_tab(self, notebook):
-        """Create the Credits tab content"""
+    def _populate_credits_tab(self, builder):
+        """Fill in the Credits tab content"""
         try:
-            credits_tab = self.widget_factory.create_about_tab(notebook, "Credits")
-            credits_grid = self.widget_factory.create_grid()
-            credits_fixed = self.widget_factory.create_fixed()
-            credits_tab.append(credits_grid)
-            credits_grid.attach(credits_fixed, 0, 0, 1, 1)
-            
             # Credits information
-            self.widget_factory.create_label(
-                credits_fixed,
-                markup="Main developer: Noel Ejemyr\n\n"
-                       "This application is licensed under the <a href='https://www.gnu.org/licenses/gpl-3.0.html'>GNU General Public License v3</a>.\n\n"
-                       "This application uses <a href='https://www.gtk.org/'>GTK</a> for its graphical interface.\n\n"
-                       "This application uses <a href='https://github.com/leogx9r/ryzen_smu'>ryzen_smu</a> for controlling Ryzen CPUs.",
-                x=10, y=10)
+            builder.get_object("credits_label").set_markup(_CREDITS_MARKUP)
                 
         except Exception as e:
             self.logger.error(f"Error creating credits tab: {e}")
@@ -104,6 +164,12 @@ class DialogManager:
     def show_more_options_popover(self, parent_button, on_settings_clicked, on_about_clicked):
         """Show the more options popover menu"""
         try:
+            # Reuse the popover already attached to this button
+            more_popover = self._more_popovers.get(parent_button)
+            if more_popover is not None:
+                more_popover.popup()
+                return
+
             more_popover = self.widget_factory.create_popover(position=Gtk.PositionType.TOP)
             more_box = self.widget_factory.create_box(more_popover)
             
@@ -116,6 +182,7 @@ class DialogManager:
                 margin_start=5, margin_end=5)
             
             more_popover.set_parent(parent_button)
+            self._more_popovers[parent_button] = more_popover
             more_popover.popup()
             
         except Exception as e:
@@ -133,10 +200,7 @@ class DialogManager:
                 secondary_text=message
             )
             
-            def on_response(dialog, response):
-                dialog.destroy()
-            
-            dialog.connect("response", on_response)
+            dialog.connect("response", _destroy_on_response)
             dialog.present()
             
         except Exception as e:
@@ -154,12 +218,7 @@ class DialogManager:
                 secondary_text=message
             )
             
-            def on_response(dialog, response):
-                if response == Gtk.ResponseType.YES:
-                    on_confirm()
-                dialog.destroy()
-            
-            dialog.connect("response", on_response)
+            dialog.connect("response", _confirm_on_response, on_confirm)
             dialog.present()
             
         except Exception as e:
@@ -174,43 +233,56 @@ class DialogManager:
             
             content_area = dialog.get_content_area()
             
-            # Create property labels
-            properties = [
-                ("Device", mount_info.get('device', 'N/A')),
-                ("Mount Point", mount_info.get('mountpoint', 'N/A')),
-                ("Filesystem", mount_info.get('fstype', 'N/A')),
-                ("Options", mount_info.get('options', 'N/A')),
-                ("Total Size", mount_info.get('total_size', 'N/A')),
-                ("Used Space", mount_info.get('used_space', 'N/A')),
-                ("Free Space", mount_info.get('free_space', 'N/A')),
-                ("Usage", mount_info.get('usage_percent', 'N/A'))
-            ]
-            
-            grid = self.widget_factory.create_grid()
-            grid.set_row_spacing(5)
-            grid.set_column_spacing(10)
-            grid.set_margin_start(10)
-            grid.set_margin_end(10)
-            grid.set_margin_top(10)
-            grid.set_margin_bottom(10)
-            
-            for i, (label_text, value_text) in enumerate(properties):
-                label = self.widget_factory.create_label(None, f"{label_text}:")
-                label.set_halign(Gtk.Align.START)
-                grid.attach(label, 0, i, 1, 1)
-                
-                value_label = self.widget_factory.create_label(None, str(value_text))
-                value_label.set_halign(Gtk.Align.START)
-                value_label.set_selectable(True)
-                grid.attach(value_label, 1, i, 1, 1)
-            
-            content_area.append(grid)
+            if _HAS_LABEL_TABS:
+                content_area.append(self._create_mount_properties_label(mount_info))
+            else:
+                content_area.append(self._create_mount_properties_grid(mount_info))
             
             # Add close button
             dialog.add_button("Close", Gtk.ResponseType.CLOSE)
-            dialog.connect("response", lambda d, r: d.destroy())
+            dialog.connect("response", _destroy_on_response)
             
             dialog.present()
             
         except Exception as e:
-            self.logger.error(f"Error showing mount properties dialog: {e}")
\ No newline at end of file
+            self.logger.error(f"Error showing mount properties dialog: {e}")
+
+    def _create_mount_properties_label(self, mount_info):
+        """Render all property rows as one tab-aligned label instead of a widget per cell"""
+        markup = "\n".join(
+            f"<b>{label_text}:</b>\t{GLib.markup_escape_text(str(mount_info.get(key, 'N/A')))}"
+            for label_text, key in self._MOUNT_PROP_ROWS)
+        properties_label = Gtk.Label.new(None)
+        properties_label.set_markup(markup)
+        properties_label.set_margin_start(10)
+        properties_label.set_margin_end(10)
+        properties_label.set_margin_top(10)
+        properties_label.set_margin_bottom(10)
+        properties_label.set_xalign(0)
+        properties_label.set_selectable(True)
+
+        tabs = Pango.TabArray.new(1, True)
+        tabs.set_tab(0, Pango.TabAlign.LEFT, 130)
+        properties_label.set_tabs(tabs)
+        return properties_label
+
+    def _create_mount_properties_grid(self, mount_info):
+        """Lay out the property rows in a two-column grid, for GTK older than 4.8"""
+        grid = self.widget_factory.create_grid()
+        grid.set_row_spacing(5)
+        grid.set_column_spacing(10)
+        grid.set_margin_start(10)
+        grid.set_margin_end(10)
+        grid.set_margin_top(10)
+        grid.set_margin_bottom(10)
+
+        for i, (label_text, key) in enumerate(self._MOUNT_PROP_ROWS):
+            label = self.widget_factory.create_label(None, f"{label_text}:")
+            label.set_halign(Gtk.Align.START)
+            grid.attach(label, 0, i, 1, 1)
+
+            value_label = self.widget_factory.create_label(None, str(mount_info.get(key, 'N/A')))
+            value_label.set_halign(Gtk.Align.START)
+            value_label.set_selectable(True)
+            grid.attach(value_label, 1, i, 1, 1)
+        return grid
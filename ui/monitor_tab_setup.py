@@ -16,9 +16,42 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import sys
+from itertools import islice
+
 import gi
 gi.require_version('Gtk', '4.0')
-from gi.repository import Gtk
+from gi.repository import Gtk, GLib
+
+from widgets.cpu_graph_area import CPUGraphArea
+from system.memory_management import MemoryGraphArea
+from system.disk_management import DiskGraphArea
+
+# (label, cpu_info key) pairs shown in the CPU Information frame
+_INFO_KEYS = (
+    ("Architecture", "Architecture"),
+    ("Physical Cores", "Physical Cores"),
+    ("Threads", "Virtual Cores (Threads)"),
+    ("Base Clock", "Base Clock"),
+    ("Max Clock", "Max Clock"),
+    ("Cache Size", "Cache Size"),
+    ("Vendor", "Vendor"),
+)
+
+# Placeholder values that mean the information is not available
+_INVALID = frozenset(("Unknown", "N/A", "", "0", None))
+
+# GtkInscription is only available on GTK 4.8 and newer
+_HAS_INSCRIPTION = hasattr(Gtk, 'Inscription')
+
+# Number of CPU tiles built per idle callback
+_CPU_TILE_BATCH = 8
+
+# Prebuilt tile texts so the tile loop does not format a new string per thread
+_MAX_CPU_NAMES = 1024
+_CPU_NAMES = tuple(sys.intern(f"CPU {i}") for i in range(_MAX_CPU_NAMES))
+_ZERO_MHZ = sys.intern("0 MHz")
+_ZERO_PCT = sys.intern("0%")
 
 class MonitorTabManager:
     """Manages the monitor tab creation and layout"""
@@ -41,39 +74,86 @@ class MonitorTabManager:
         self.current_governor_label = None
         self.thermal_throttle_label = None
         
+        # False while per-thread CPU tiles are still being streamed in at idle time
+        self.tiles_ready = True
+        
+        # Last values applied to the dynamic labels, used to skip redundant updates
+        self._last_temp = None
+        self._last_governor = None
+        self._last_throttling = None
+        
+        # Last built widget tree and the cpu_info it was built from
+        self._cached_root = None
+        self._last_build_key = None
+        
+        # Bumped on every build so idle callbacks queued for an older tree stop early
+        self._build_generation = 0
+        
     def create_monitor_widgets(self, monitor_box):
         """Create all widgets for the monitor tab"""
         try:
             # Get CPU information
             cpu_info = self.cpu_manager.get_cpu_info()
 
+            # cpu_info holds lists and dicts, so key the cache on its repr
+            build_key = repr(sorted(cpu_info.items()))
+            if self._cached_root is not None:
+                old_parent = self._cached_root.get_parent()
+                if build_key == self._last_build_key:
+                    # Same CPU: reuse the existing tiles instead of rebuilding them
+                    if old_parent is not monitor_box:
+                        if old_parent is not None:
+                            old_parent.remove(self._cached_root)
+                        monitor_box.append(self._cached_root)
+                    return
+                # Drop the old tree and the references the update code holds into it
+                if old_parent is not None:
+                    old_parent.remove(self._cached_root)
+                self.clock_labels.clear()
+                self.usage_labels.clear()
+                self.cpu_graphs.clear()
+                self.disk_manager.disk_graphs.clear()
+                self.disk_manager.disk_usage_labels.clear()
+                self.disk_manager.disk_details_labels.clear()
+
+            # Invalidate the tile and disk idle callbacks still pending for the old tree
+            self._build_generation += 1
+
+            # Build every section into a detached container and attach it once at the end
+            root = self.widget_factory.create_vertical_box()
+            root.freeze_notify()
+
             # CPU Model Name at the top
             if "Model Name" in cpu_info:
                 model_name = cpu_info["Model Name"]
-                model_label = self.widget_factory.create_label(
-                    monitor_box, text=model_name)
+                model_label = self._make_label('medium-label', model_name)
                 model_label.set_justify(Gtk.Justification.CENTER)
                 model_label.set_wrap(True)
                 model_label.set_halign(Gtk.Align.CENTER)
-                model_label.add_css_class('medium-label')
                 model_label.set_margin_bottom(10)
+                root.append(model_label)
 
             # Create CPU graphs section
-            self._create_cpu_graphs_section(monitor_box, cpu_info)
+            self._create_cpu_graphs_section(root, cpu_info)
             
             # Create system info section
-            self._create_system_info_section(monitor_box, cpu_info)
+            self._create_system_info_section(root, cpu_info)
             
             # Create memory graphs section
-            self._create_memory_graphs_section(monitor_box)
+            self._create_memory_graphs_section(root)
             
             # Create disk graphs section
-            self._create_disk_graphs_section(monitor_box)
+            self._create_disk_graphs_section(root)
+
+            root.thaw_notify()
+            monitor_box.append(root)
+            self._cached_root = root
+            self._last_build_key = build_key
             
         except Exception as e:
             self.logger.error(f"Error creating monitor widgets: {e}")
     
-    def _create_cpu_graphs_section(self, monitor_box, cpu_info):
+    def _create_cpu_graphs_section(self, parent, cpu_info):
         """Create the CPU graphs flow box section"""
         try:
             # Create a flow box for CPU graphs that will wrap based on available space
@@ -85,78 +165,23 @@ class MonitorTabManager:
                 column_spacing=10,
                 homogeneous=True,
                 selection_mode=Gtk.SelectionMode.NONE)
-            monitor_box.append(cpu_graphs_flow)
+            parent.append(cpu_graphs_flow)
 
             # Create individual CPU graphs - one per thread
             threads = cpu_info.get("Virtual Cores (Threads)", cpu_info.get("Threads", self.cpu_manager.cpu_file_search.thread_count))
             
-            # Create graphs for each thread
-            for i in range(threads):
-                # Create frame for CPU graph
-                cpu_frame = self.widget_factory.create_frame()
-                cpu_frame.set_size_request(120, 90)
-                cpu_graphs_flow.append(cpu_frame)
-                
-                # Create overlay for positioning labels over the graph
-                cpu_overlay = self.widget_factory.create_overlay()
-                cpu_frame.set_child(cpu_overlay)
-                
-                # Create CPU graph area
-                from widgets.cpu_graph_area import CPUGraphArea
-                cpu_graph = CPUGraphArea(i)
-                cpu_graph.set_content_width(100)
-                cpu_graph.set_content_height(80)
-                cpu_overlay.set_child(cpu_graph)
-                self.cpu_graphs[i] = cpu_graph  # Use integer index like original
-                
-                # Create labels box positioned over the graph
-                cpu_labels_box = self.widget_factory.create_vertical_box()
-                cpu_labels_box.set_valign(Gtk.Align.FILL)
-                cpu_labels_box.set_halign(Gtk.Align.FILL)
-                
-                # Top row for thread label
-                top_row = self.widget_factory.create_horizontal_box(
-                    margin_start=5, margin_end=5, margin_top=5)
-                
-                thread_label = self.widget_factory.create_label(top_row, text=f"CPU {i}")
-                thread_label.set_halign(Gtk.Align.START)
-                thread_label.add_css_class('small-label')
-                
-                cpu_labels_box.append(top_row)
-                
-                # Center spacer
-                center_spacer = self.widget_factory.create_vertical_box(vexpand=True)
-                cpu_labels_box.append(center_spacer)
-                
-                # Bottom row for usage and clock labels (positioned left and right)
-                bottom_row = self.widget_factory.create_horizontal_box(
-                    margin_start=5, margin_end=5, margin_bottom=5)
-                
-                # Clock frequency label (left side)
-                clock_label = self.widget_factory.create_label(bottom_row, text="0 MHz")
-                clock_label.set_halign(Gtk.Align.START)
-                clock_label.add_css_class('small-label')
-                self.clock_labels[i] = clock_label  # Use integer index
-                
-                # Spacer to push usage label to the right
-                spacer = self.widget_factory.create_horizontal_box(hexpand=True)
-                bottom_row.append(spacer)
-                
-                # Usage percentage label (right side)
-                usage_label = self.widget_factory.create_label(bottom_row, text="0%")
-                usage_label.set_halign(Gtk.Align.END)
-                usage_label.add_css_class('medium-header')
-                self.usage_labels[i] = usage_label  # Use integer index
-                
-                cpu_labels_box.append(bottom_row)
-                
-                # Add labels overlay to graph
-                cpu_overlay.add_overlay(cpu_labels_box)
+            # Build the first batch of tiles now and stream the rest in at idle time
+            tiles = iter(range(threads))
+            self.tiles_ready = False
+            generation = self._build_generation
+            if self._create_cpu_tile_batch(cpu_graphs_flow, tiles, generation):
+                GLib.idle_add(self._create_cpu_tile_batch, cpu_graphs_flow, tiles, generation,
+                              priority=GLib.PRIORITY_LOW)
             
             # Create average CPU graph (separate from thread graphs, spans full width)
             avg_cpu_frame = self.widget_factory.create_frame()
             avg_cpu_frame.set_size_request(400, 120)
-            monitor_box.append(avg_cpu_frame)
+            parent.append(avg_cpu_frame)
             
             # Create overlay for average graph
             avg_cpu_overlay = self.widget_factory.create_overlay()
@@ -169,95 +194,127 @@ class MonitorTabManager:
             avg_cpu_overlay.set_child(avg_cpu_graph)
             self.avg_usage_graph = avg_cpu_graph
             
-            # Create labels box for average graph
-            avg_labels_box = self.widget_factory.create_vertical_box()
-            avg_labels_box.set_valign(Gtk.Align.FILL)
-            avg_labels_box.set_halign(Gtk.Align.FILL)
-            
-            # Top row for average label
-            avg_top_row = self.widget_factory.create_horizontal_box(
-                margin_start=5, margin_end=5, margin_top=5)
+            # Labels grid for average graph
+            avg_labels_grid = self._create_overlay_grid(avg_cpu_overlay)
             
-            avg_label = self.widget_factory.create_label(avg_top_row, text="Average")
+            # Average label (top left)
+            avg_label = self._make_label('small-label', "Average")
             avg_label.set_halign(Gtk.Align.START)
-            avg_label.add_css_class('small-label')
+            avg_labels_grid.attach(avg_label, 0, 0, 1, 1)
             
-            avg_labels_box.append(avg_top_row)
-            
-            # Center spacer for average
-            avg_center_spacer = self.widget_factory.create_vertical_box(vexpand=True)
-            avg_labels_box.append(avg_center_spacer)
-            
-            # Bottom row for average usage and clock labels (positioned left and right)
-            avg_bottom_row = self.widget_factory.create_horizontal_box(
-                margin_start=5, margin_end=5, margin_bottom=5)
-            
-            # Average clock frequency label (left side)
-            avg_clock_label = self.widget_factory.create_label(avg_bottom_row, text="0 MHz")
+            # Average clock frequency label (bottom left)
+            avg_clock_label = self._make_readout('small-label', _ZERO_MHZ, 0.0, 8)
             avg_clock_label.set_halign(Gtk.Align.START)
-            avg_clock_label.add_css_class('small-label')
+            avg_clock_label.set_valign(Gtk.Align.END)
+            avg_clock_label.set_vexpand(True)
+            avg_labels_grid.attach(avg_clock_label, 0, 1, 1, 1)
             self.avg_clock_label = avg_clock_label
             
-            # Spacer to push usage label to the right
-            avg_spacer = self.widget_factory.create_horizontal_box(hexpand=True)
-            avg_bottom_row.append(avg_spacer)
-            
-            # Average usage percentage label (right side)
-            avg_usage_label = self.widget_factory.create_label(avg_bottom_row, text="0%")
+            # Average usage percentage label (bottom right)
+            avg_usage_label = self._make_readout('medium-header', _ZERO_PCT, 1.0, 8)
             avg_usage_label.set_halign(Gtk.Align.END)
-            avg_usage_label.add_css_class('medium-header')
+            avg_usage_label.set_valign(Gtk.Align.END)
+            avg_usage_label.set_hexpand(True)
+            avg_labels_grid.attach(avg_usage_label, 1, 1, 1, 1)
             self.avg_usage_label = avg_usage_label
-            
-            avg_labels_box.append(avg_bottom_row)
-            
-            # Add labels overlay to average graph
-            avg_cpu_overlay.add_overlay(avg_labels_box)
                 
         except Exception as e:
             self.logger.error(f"Error creating CPU graphs section: {e}")
     
-    def _create_system_info_section(self, monitor_box, cpu_info):
+    def _create_cpu_tile_batch(self, flow, tiles, generation):
+        """Create the next batch of per-thread CPU tiles, returning True while more may remain"""
+        # The tree this batch belongs to has been replaced
+        if generation != self._build_generation:
+            return False
+        try:
+            Frame = Gtk.Frame
+            
+            count = 0
+            for i in islice(tiles, _CPU_TILE_BATCH):
+                # Create frame for CPU graph
+                cpu_frame = Frame(width_request=120, height_request=90)
+                flow.append(cpu_frame)
+                
+                # Create CPU graph area; it draws the thread name, clock and usage itself
+                cpu_graph = CPUGraphArea(i)
+                cpu_graph.set_content_width(100)
+                cpu_graph.set_content_height(80)
+                cpu_graph.set_header_text(_CPU_NAMES[i] if i < _MAX_CPU_NAMES else f"CPU {i}")
+                cpu_graph.set_clock_text(_ZERO_MHZ)
+                cpu_graph.set_usage_text(_ZERO_PCT)
+                cpu_frame.set_child(cpu_graph)
+                self.cpu_graphs[i] = cpu_graph  # Use integer index like original
+                
+                # Label-like handles so the update code can keep calling set_text/set_visible
+                self.clock_labels[i] = cpu_graph.clock_handle()  # Use integer index
+                self.usage_labels[i] = cpu_graph.usage_handle()  # Use integer index
+                count += 1
+            
+            # A short batch means the iterator is exhausted
+            if count == _CPU_TILE_BATCH:
+                return True
+            self.tiles_ready = True
+            return False
+        except Exception as e:
+            self.logger.error(f"Error creating CPU tiles: {e}")
+            self.tiles_ready = True
+            return False
+    
+    def _make_label(self, style, text, **props):
+        """Create a label with its CSS class set at construction"""
+        return Gtk.Label(label=text, css_classes=[style], **props)
+    
+    def _make_readout(self, style, text, xalign, nat_chars, lines=1, **props):
+        """Create a fixed-width readout for a value that changes every update"""
+        # Inscriptions are sized from character counts, so set_text() does not re-measure
+        if not _HAS_INSCRIPTION:
+            return self._make_label(style, text, xalign=xalign, **props)
+        return Gtk.Inscription(text=text, xalign=xalign, min_chars=8, nat_chars=nat_chars,
+                               min_lines=lines, nat_lines=lines,
+                               text_overflow=Gtk.InscriptionOverflow.ELLIPSIZE_END,
+                               css_classes=[style], **props)
+    
+    def _create_overlay_grid(self, overlay):
+        """Create the grid that positions a tile's labels over its graph"""
+        grid = Gtk.Grid(valign=Gtk.Align.FILL, halign=Gtk.Align.FILL,
+                        margin_start=5, margin_end=5, margin_top=5, margin_bottom=5)
+        overlay.add_overlay(grid)
+        return grid
+    
+    def _create_system_info_section(self, parent, cpu_info):
         """Create the system information section"""
         try:
             # CPU Info Grid
             cpu_info_frame = self.widget_factory.create_frame()
             cpu_info_frame.set_label("CPU Information")
-            monitor_box.append(cpu_info_frame)
+            parent.append(cpu_info_frame)
             cpu_info_grid = self.widget_factory.create_grid()
             cpu_info_frame.set_child(cpu_info_grid)
 
             row = 0
-            info_items = [
-                ("Architecture", cpu_info.get("Architecture")),
-                ("Physical Cores", cpu_info.get("Physical Cores")),
-                ("Threads", cpu_info.get("Virtual Cores (Threads)")),
-                ("Base Clock", cpu_info.get("Base Clock")),
-                ("Max Clock", cpu_info.get("Max Clock")),
-                ("Cache Size", cpu_info.get("Cache Size")),
-                ("Vendor", cpu_info.get("Vendor"))
-            ]
-
-            for label_text, value in info_items:
+            for label_text, key in _INFO_KEYS:
+                value = cpu_info.get(key)
                 # Only show items that have valid data (not None, "Unknown", "N/A", or empty)
-                if value and value not in ["Unknown", "N/A", "", "0"]:
-                    # Convert to string if it's a number
-                    value_text = str(value) if not isinstance(value, str) else value
+                if value and value not in _INVALID:
+                    # str() returns string values unchanged and converts numbers
+                    value_text = str(value)
                     
-                    label = self.widget_factory.create_label(
-                        cpu_info_grid, text=f"{label_text}:", x=0, y=row)
+                    label = self._make_label('small-label', f"{label_text}:")
                     label.set_halign(Gtk.Align.START)
-                    label.add_css_class('small-label')
+                    cpu_info_grid.attach(label, 0, row, 1, 1)
 
-                    value_label = self.widget_factory.create_label(
-                        cpu_info_grid, text=value_text, x=1, y=row)
+                    value_label = self._make_label('small-label', value_text)
                     value_label.set_halign(Gtk.Align.START)
-                    value_label.add_css_class('small-label')
+                    cpu_info_grid.attach(value_label, 1, row, 1, 1)
                     row += 1
             
             # Initialize dynamic label references (will be created conditionally)
             self.package_temp_label = None
             self.current_governor_label = None
             self.thermal_throttle_label = None
+            self._last_temp = None
+            self._last_governor = None
+            self._last_throttling = None
             
             # Store grid and row info for dynamic updates
             self.cpu_info_grid = cpu_info_grid
@@ -268,17 +325,18 @@ class MonitorTabManager:
     
     def create_temp_label_if_needed(self, temp_value):
         """Create temperature label only if temp value is valid"""
+        if temp_value == self._last_temp:
+            return
+        self._last_temp = temp_value
         if temp_value and temp_value not in ["N/A", "Unknown", "", "0°C", "0"]:
             if not self.package_temp_label:
-                temp_label = self.widget_factory.create_label(
-                    self.cpu_info_grid, text="Temperature:", x=0, y=self.current_grid_row)
+                temp_label = self._make_label('small-label', "Temperature:")
                 temp_label.set_halign(Gtk.Align.START)
-                temp_label.add_css_class('small-label')
+                self.cpu_info_grid.attach(temp_label, 0, self.current_grid_row, 1, 1)
                 
-                self.package_temp_label = self.widget_factory.create_label(
-                    self.cpu_info_grid, text=temp_value, x=1, y=self.current_grid_row)
+                self.package_temp_label = self._make_label('small-label', temp_value)
                 self.package_temp_label.set_halign(Gtk.Align.START)
-                self.package_temp_label.add_css_class('small-label')
+                self.cpu_info_grid.attach(self.package_temp_label, 1, self.current_grid_row, 1, 1)
                 self.current_grid_row += 1
             else:
                 self.package_temp_label.set_text(temp_value)
@@ -288,17 +346,18 @@ class MonitorTabManager:
     
     def create_governor_label_if_needed(self, governor_value):
         """Create governor label only if governor value is valid"""
+        if governor_value == self._last_governor:
+            return
+        self._last_governor = governor_value
         if governor_value and governor_value not in ["Unknown", "N/A", "", "none"]:
             if not self.current_governor_label:
-                governor_label = self.widget_factory.create_label(
-                    self.cpu_info_grid, text="Governor:", x=0, y=self.current_grid_row)
+                governor_label = self._make_label('small-label', "Governor:")
                 governor_label.set_halign(Gtk.Align.START)
-                governor_label.add_css_class('small-label')
+                self.cpu_info_grid.attach(governor_label, 0, self.current_grid_row, 1, 1)
                 
-                self.current_governor_label = self.widget_factory.create_label(
-                    self.cpu_info_grid, text=governor_value, x=1, y=self.current_grid_row)
+                self.current_governor_label = self._make_label('small-label', governor_value)
                 self.current_governor_label.set_halign(Gtk.Align.START)
-                self.current_governor_label.add_css_class('small-label')
+                self.cpu_info_grid.attach(self.current_governor_label, 1, self.current_grid_row, 1, 1)
                 self.current_grid_row += 1
             else:
                 self.current_governor_label.set_text(governor_value)
@@ -309,18 +368,19 @@ class MonitorTabManager:
     
     def create_thermal_status_label_if_needed(self, is_throttling):
         """Create thermal status label only if there's actual throttling"""
+        if is_throttling == self._last_throttling:
+            return
+        self._last_throttling = is_throttling
         if is_throttling:
             if not self.thermal_throttle_label:
-                throttle_label = self.widget_factory.create_label(
-                    self.cpu_info_grid, text="Thermal Status:", x=0, y=self.current_grid_row)
+                throttle_label = self._make_label('small-label', "Thermal Status:")
                 throttle_label.set_halign(Gtk.Align.START)
-                throttle_label.add_css_class('small-label')
+                self.cpu_info_grid.attach(throttle_label, 0, self.current_grid_row, 1, 1)
                 
-                self.thermal_throttle_label = self.widget_factory.create_label(
-                    self.cpu_info_grid, text="Throttling", x=1, y=self.current_grid_row)
+                self.thermal_throttle_label = self._make_label('small-label', "Throttling")
                 self.thermal_throttle_label.set_halign(Gtk.Align.START)
-                self.thermal_throttle_label.add_css_class('small-label')
                 self.thermal_throttle_label.set_markup('<span foreground="red">Throttling</span>')
+                self.cpu_info_grid.attach(self.thermal_throttle_label, 1, self.current_grid_row, 1, 1)
                 self.current_grid_row += 1
             else:
                 self.thermal_throttle_label.set_markup('<span foreground="red">Throttling</span>')
@@ -329,19 +389,17 @@ class MonitorTabManager:
             # Hide when not throttling
             self.thermal_throttle_label.set_visible(False)
     
-    def _create_memory_graphs_section(self, monitor_box):
+    def _create_memory_graphs_section(self, parent):
         """Create the memory monitoring section"""
         try:
             # Memory section header
-            memory_header = self.widget_factory.create_label(monitor_box, text="System Memory")
-            memory_header.add_css_class('medium-header')
-            memory_header.set_margin_top(20)
-            memory_header.set_margin_bottom(10)
-            memory_header.set_halign(Gtk.Align.START)
+            memory_header = self._make_label('medium-header', "System Memory",
+                                             margin_top=20, margin_bottom=10, halign=Gtk.Align.START)
+            parent.append(memory_header)
             
             # Create a box for memory graphs that can stack responsively
             memory_graphs_box = self.widget_factory.create_horizontal_box(spacing=20, homogeneous=False)
-            monitor_box.append(memory_graphs_box)
+            parent.append(memory_graphs_box)
 
             # Memory usage graph
             memory_frame = self.widget_factory.create_frame()
@@ -354,7 +412,6 @@ class MonitorTabManager:
             memory_frame.set_child(memory_overlay)
             
             # Create memory graph
-            from system.memory_management import MemoryGraphArea
             memory_graph = MemoryGraphArea("memory")
             memory_graph.set_content_width(280)
             memory_graph.set_content_height(120)
@@ -363,48 +420,31 @@ class MonitorTabManager:
             # Store reference for updates
             self.memory_manager.memory_graph = memory_graph
             
-            # Memory labels overlay
-            memory_labels_box = self.widget_factory.create_vertical_box()
-            memory_labels_box.set_valign(Gtk.Align.FILL)
-            memory_labels_box.set_halign(Gtk.Align.FILL)
-            
-            # Top row for memory
-            memory_top_row = self.widget_factory.create_horizontal_box(
-                margin_start=5, margin_end=5, margin_top=5)
-            
-            memory_header = self.widget_factory.create_label(memory_top_row, text="Memory")
-            memory_header.set_halign(Gtk.Align.START)
-            memory_header.add_css_class('medium-header')
+            # Memory labels grid
+            memory_labels_grid = self._create_overlay_grid(memory_overlay)
             
-            memory_spacer = self.widget_factory.create_horizontal_box(hexpand=True)
-            memory_top_row.append(memory_spacer)
+            memory_inline_label = self._make_label('medium-header', "Memory", halign=Gtk.Align.START)
+            memory_labels_grid.attach(memory_inline_label, 0, 0, 1, 1)
             
-            memory_usage_label = self.widget_factory.create_label(memory_top_row, text="0.0%")
+            memory_usage_label = self._make_readout('thick-header', "0.0%", 1.0, 8)
             memory_usage_label.set_halign(Gtk.Align.END)
-            memory_usage_label.add_css_class('thick-header')
+            memory_usage_label.set_hexpand(True)
+            memory_labels_grid.attach(memory_usage_label, 1, 0, 1, 1)
             self.memory_manager.memory_usage_label = memory_usage_label
             
-            memory_labels_box.append(memory_top_row)
-            
-            # Bottom spacer for memory
-            memory_bottom_spacer = self.widget_factory.create_vertical_box(vexpand=True)
-            memory_labels_box.append(memory_bottom_spacer)
-            
-            # Bottom row for memory details
-            memory_bottom_row = self.widget_factory.create_horizontal_box(
-                margin_start=5, margin_bottom=5)
-            
-            memory_details_label = self.widget_factory.create_label(memory_bottom_row, text="Memory: 0.0 GB / 0.0 GB")
+            # Memory details (bottom, spanning both columns)
+            memory_details_label = self._make_readout('medium-label', "Memory: 0.0 GB / 0.0 GB", 0.0, 28, lines=2)
             memory_details_label.set_halign(Gtk.Align.START)
-            memory_details_label.add_css_class('medium-label')
+            memory_details_label.set_valign(Gtk.Align.END)
+            memory_details_label.set_vexpand(True)
+            memory_labels_grid.attach(memory_details_label, 0, 1, 2, 1)
             self.memory_manager.memory_details_label = memory_details_label
             
-            memory_labels_box.append(memory_bottom_row)
-            memory_overlay.add_overlay(memory_labels_box)
-            
-            # Swap usage graph
+            # Swap usage graph, hidden until swap is configured; update_memory_gui shows it
+            # once swap appears (e.g. after swapon). A read error (None) leaves it visible.
             swap_frame = self.widget_factory.create_frame()
             swap_frame.set_size_request(280, 120)
+            swap_frame.set_visible(self.memory_manager.get_swap_total() != 0)
             memory_graphs_box.append(swap_frame)
 
             # Create overlay for swap graph
@@ -421,57 +461,39 @@ class MonitorTabManager:
             self.memory_manager.swap_graph = swap_graph
             self.memory_manager.swap_frame = swap_frame  # Store frame reference for hiding/showing
             
-            # Swap labels overlay
-            swap_labels_box = self.widget_factory.create_vertical_box()
-            swap_labels_box.set_valign(Gtk.Align.FILL)
-            swap_labels_box.set_halign(Gtk.Align.FILL)
-            
-            # Top row for swap
-            swap_top_row = self.widget_factory.create_horizontal_box(
-                margin_start=5, margin_end=5, margin_top=5)
+            # Swap labels grid
+            swap_labels_grid = self._create_overlay_grid(swap_overlay)
             
-            swap_header = self.widget_factory.create_label(swap_top_row, text="Swap")
+            swap_header = self._make_label('medium-header', "Swap")
             swap_header.set_halign(Gtk.Align.START)
-            swap_header.add_css_class('medium-header')
+            swap_labels_grid.attach(swap_header, 0, 0, 1, 1)
             
-            swap_spacer = self.widget_factory.create_horizontal_box(hexpand=True)
-            swap_top_row.append(swap_spacer)
-            
-            swap_usage_label = self.widget_factory.create_label(swap_top_row, text="0.0%")
+            swap_usage_label = self._make_readout('thick-header', "0.0%", 1.0, 8)
             swap_usage_label.set_halign(Gtk.Align.END)
-            swap_usage_label.add_css_class('thick-header')
+            swap_usage_label.set_hexpand(True)
+            swap_labels_grid.attach(swap_usage_label, 1, 0, 1, 1)
             self.memory_manager.swap_usage_label = swap_usage_label
             
-            swap_labels_box.append(swap_top_row)
-            
-            # Bottom spacer for swap
-            swap_bottom_spacer = self.widget_factory.create_vertical_box(vexpand=True)
-            swap_labels_box.append(swap_bottom_spacer)
-            
-            # Bottom row for swap details
-            swap_bottom_row = self.widget_factory.create_horizontal_box(
-                margin_start=5, margin_bottom=5)
-            
-            swap_details_label = self.widget_factory.create_label(swap_bottom_row, text="Swap: 0.0 GB / 0.0 GB")
+            # Swap details (bottom, spanning both columns)
+            swap_details_label = self._make_readout('medium-label', "Swap: 0.0 GB / 0.0 GB", 0.0, 28)
             swap_details_label.set_halign(Gtk.Align.START)
-            swap_details_label.add_css_class('medium-label')
+            swap_details_label.set_valign(Gtk.Align.END)
+            swap_details_label.set_vexpand(True)
+            swap_labels_grid.attach(swap_details_label, 0, 1, 2, 1)
             self.memory_manager.swap_details_label = swap_details_label
-            
-            swap_labels_box.append(swap_bottom_row)
-            swap_overlay.add_overlay(swap_labels_box)
                 
         except Exception as e:
             self.logger.error(f"Error creating memory graphs section: {e}")
     
-    def _create_disk_graphs_section(self, monitor_box):
+    def _create_disk_graphs_section(self, parent):
         """Create the disk monitoring section with individual graphs per disk"""
         try:
             # Disk section header  
-            disk_header = self.widget_factory.create_label(monitor_box, text="Disk Usage")
-            disk_header.add_css_class('medium-header')
+            disk_header = self._make_label('medium-header', "Disk Usage")
             disk_header.set_margin_top(20)
             disk_header.set_margin_bottom(10)
             disk_header.set_halign(Gtk.Align.START)
+            parent.append(disk_header)
             
             # Initialize disk manager's graph storage if not already done
             if not hasattr(self.disk_manager, 'disk_graphs'):
@@ -489,20 +511,22 @@ class MonitorTabManager:
             # Create a graph for each discovered disk
             for device_name, disk_info in self.disk_manager.disks.items():
                 self.logger.info(f"Creating disk graph for {device_name}")
-                self._create_single_disk_graph(monitor_box, device_name, disk_info)
+                GLib.idle_add(self._create_single_disk_graph, parent, device_name, disk_info,
+                              self._build_generation, priority=GLib.PRIORITY_LOW)
                 
         except Exception as e:
             self.logger.error(f"Error creating disk graphs section: {e}")
     
-    def _create_single_disk_graph(self, monitor_box, device_name, disk_info):
+    def _create_single_disk_graph(self, parent, device_name, disk_info, generation):
         """Create a single disk graph for the specified device"""
+        # The tree this graph belongs to has been replaced
+        if generation != self._build_generation:
+            return False
         try:
-            from system.disk_management import DiskGraphArea
-            
             # Create disk graph frame
             disk_frame = self.widget_factory.create_frame()
             disk_frame.set_size_request(400, 120)
-            monitor_box.append(disk_frame)
+            parent.append(disk_frame)
             
             # Create overlay for disk graph
             disk_overlay = self.widget_factory.create_overlay()
@@ -517,51 +541,31 @@ class MonitorTabManager:
             # Store reference for updates
             self.disk_manager.disk_graphs[device_name] = disk_graph
             
-            # Disk labels overlay
-            disk_labels_box = self.widget_factory.create_vertical_box()
-            disk_labels_box.set_valign(Gtk.Align.FILL)
-            disk_labels_box.set_halign(Gtk.Align.FILL)
-            
-            # Top row for disk
-            disk_top_row = self.widget_factory.create_horizontal_box(
-                margin_start=5, margin_end=5, margin_top=5)
+            # Disk labels grid
+            disk_labels_grid = self._create_overlay_grid(disk_overlay)
             
             # Display device name and model
-            disk_title = f"{device_name} ({disk_info.model})"
-            if len(disk_title) > 40:  # Truncate if too long
-                disk_title = disk_title[:37] + "..."
-            
-            disk_header = self.widget_factory.create_label(disk_top_row, text=disk_title)
+            disk_header = self._make_label('medium-header', disk_info.display_title)
             disk_header.set_halign(Gtk.Align.START)
-            disk_header.add_css_class('medium-header')
-            
-            disk_spacer = self.widget_factory.create_horizontal_box(hexpand=True)
-            disk_top_row.append(disk_spacer)
+            disk_labels_grid.attach(disk_header, 0, 0, 1, 1)
             
-            disk_usage_label = self.widget_factory.create_label(disk_top_row, text="0 B/s")
+            disk_usage_label = self._make_readout('thick-header', "0 B/s", 1.0, 12)
             disk_usage_label.set_halign(Gtk.Align.END)
-            disk_usage_label.add_css_class('thick-header')
+            disk_usage_label.set_hexpand(True)
+            disk_labels_grid.attach(disk_usage_label, 1, 0, 1, 1)
 
-            disk_labels_box.append(disk_top_row)
-
-            # Bottom spacer for disk
-            disk_bottom_spacer = self.widget_factory.create_vertical_box(vexpand=True)
-            disk_labels_box.append(disk_bottom_spacer)
-
-            # Bottom row for disk details
-            disk_bottom_row = self.widget_factory.create_horizontal_box(
-                margin_start=5, margin_bottom=5)
-
-            disk_details_label = self.widget_factory.create_label(disk_bottom_row, text=f"Size: {disk_info.size} | Read: 0 B/s | Write: 0 B/s")
+            # Disk details (bottom, spanning both columns)
+            disk_details_label = self._make_readout('medium-label', f"{disk_info.details_prefix}Read: 0 B/s | Write: 0 B/s", 0.0, 48)
             disk_details_label.set_halign(Gtk.Align.START)
-            disk_details_label.add_css_class('medium-label')
+            disk_details_label.set_valign(Gtk.Align.END)
+            disk_details_label.set_vexpand(True)
+            disk_labels_grid.attach(disk_details_label, 0, 1, 2, 1)
             
             # Store references for updates
             self.disk_manager.disk_usage_labels[device_name] = disk_usage_label
             self.disk_manager.disk_details_labels[device_name] = disk_details_label
-            
-            disk_labels_box.append(disk_bottom_row)
-            disk_overlay.add_overlay(disk_labels_box)
                 
         except Exception as e:
-            self.logger.error(f"Error creating disk graph for {device_name}: {e}")
\ No newline at end of file
+            self.logger.error(f"Error creating disk graph for {device_name}: {e}")
+        # Run once when scheduled from idle
+        return False
\ No newline at end of file
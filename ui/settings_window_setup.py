@@ -20,7 +20,14 @@ import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk, GLib
 
+# Config values for the boolean UI settings, in both directions
+_BOOL_TO_STR = {True: 'true', False: 'false'}
+_STR_TO_BOOL = {'true': True, 'false': False}
+
 class SettingsWindow:
+    # Delay before a changed update interval is applied, so held arrows apply once
+    INTERVAL_APPLY_DELAY_MS = 80
+
     def __init__(self, config_manager, logger, global_state, gui_components, widget_factory, settings_applier, cpu_manager, scale_manager, process_manager, main_app):
         # References to instances
         self.config_manager = config_manager
@@ -34,12 +41,44 @@ class SettingsWindow:
         self.process_manager = process_manager
         self.main_app = main_app
 
-        # Call methods on startup
+        # Information dialogs, built on first use and reused afterwards
+        self._info_windows = {}
+
+        # The settings window is built the first time it is opened
+        self._built = False
+
+        # Default GtkSettings, looked up on first use
+        self._gtk_settings = None
+
+        # Pending timeout that applies the latest update interval
+        self._interval_source_id = 0
+
+        # Pending idle callback that applies the latest dark mode choice
+        self._dark_mode_source_id = 0
+
+        # Pending idle callback that writes changed settings to disk
+        self._config_save_source_id = 0
+
+        # Graphs redrawn on theme changes, collected on first refresh
+        self._graph_drawables = None
+        self._graph_drawables_count = 0
+
+        # Toggle handlers keyed by checkbutton, dispatched from _on_toggle
+        self._toggle_handlers = {}
+
+    def _ensure_built(self):
+        # Build the settings window and its widgets on first use
+        if self._built:
+            return
+        self._built = True
         self.setup_main_settings_window()
-        self.setup_main_settings_box()
         self.setup_settings_gui()
         self.add_settings_widgets_to_gui_components()
 
+        # Hand the new widgets to the managers that looked them up at startup
+        self.scale_manager.disable_scale_limits_checkbutton = self.disable_scale_limits_checkbutton
+        self.init_dark_mode_setting()
+
     def setup_main_settings_window(self):
         # Create the settings window
         try:
@@ -51,6 +90,8 @@ class SettingsWindow:
     def open_settings_window(self, widget=None, data=None):
         # Open the settings window
         try:
+            self._ensure_built()
+
             # Set transient parent when opening (main window should be available now)
             if hasattr(self.main_app, 'window') and self.main_app.window:
                 self.settings_window.set_transient_for(self.main_app.window)
@@ -66,72 +107,48 @@ class SettingsWindow:
         except Exception as e:
             self.logger.error(f"Error closing settings window: {e}")
 
-    def setup_main_settings_box(self):
-        # Setup the main settings box
-        try:
-            self.main_settings_box = self.widget_factory.create_box(self.settings_window)
-        except Exception as e:
-            self.logger.error(f"Error setting up settings box: {e}")
-
     def setup_settings_gui(self):
-        # Setup the settings GUI components directly in the main box
+        # Setup the settings GUI components directly in the settings window
         try:
-            # Create a fixed layout container for precise positioning
-            settings_fixed = self.widget_factory.create_fixed()
-            self.main_settings_box.append(settings_fixed)
-
-            # Add some margin around the settings
-            settings_fixed.set_margin_start(10)
-            settings_fixed.set_margin_end(10)
-            settings_fixed.set_margin_top(10)
-            settings_fixed.set_margin_bottom(10)
-
-            # Create the Disable Scale Limits checkbutton
-            self.disable_scale_limits_checkbutton = self.widget_factory.create_checkbutton(
-                settings_fixed, "Disable Scale Limits", self.global_state.disable_scale_limits, self.scale_manager.on_disable_scale_limits_change, x=5, y=10)
-
-            # Create the info button for the Disable Scale Limits checkbutton
-            info_button_scale = self.widget_factory.create_info_button(
-                settings_fixed, self.scale_info_window, x=200, y=10)
-
-            # Create the MHz to GHz toggle checkbutton
-            self.mhz_to_ghz_checkbutton = self.widget_factory.create_checkbutton(
-                settings_fixed, "Display GHz", self.global_state.display_ghz, self.on_mhz_to_ghz_toggle, x=5, y=40)
-
-            # Create the info button for the MHz to GHz checkbutton
-            info_button_mhz_to_ghz = self.widget_factory.create_info_button(
-                settings_fixed, self.mhz_to_ghz_info_window, x=200, y=40)
-
-            # Create the Apply On Boot checkbutton (initially disabled)
-            self.apply_on_boot_checkbutton = self.widget_factory.create_checkbutton(
-                settings_fixed, "Apply On Boot", None, self.on_apply_on_boot_toggle, x=5, y=70)
+            # Lay the settings out on a grid: toggles in column 0, info buttons in column 1
+            settings_grid = Gtk.Grid(column_spacing=8, row_spacing=6,
+                                     margin_start=10, margin_end=10, margin_top=10, margin_bottom=10)
+            self.settings_window.set_child(settings_grid)
+
+            # One row per toggle: (attribute, label, initial state, toggle handler, info handler)
+            rows = (
+                ('disable_scale_limits_checkbutton', "Disable Scale Limits", self.global_state.disable_scale_limits,
+                 self.scale_manager.on_disable_scale_limits_change, self.scale_info_window),
+                ('mhz_to_ghz_checkbutton', "Display GHz", self.global_state.display_ghz,
+                 self.on_mhz_to_ghz_toggle, self.mhz_to_ghz_info_window),
+                ('apply_on_boot_checkbutton', "Apply On Boot", False,
+                 self.on_apply_on_boot_toggle, self.apply_boot_info_window),
+                ('dark_mode_checkbutton', "Dark Mode", self.get_current_theme_preference(),
+                 self.on_dark_mode_toggle, self.dark_mode_info_window),
+                ('remember_window_size_checkbutton', "Remember Window Size", self.get_current_window_size_preference(),
+                 self.on_remember_window_size_toggle, self.window_size_info_window),
+            )
+
+            # Create each checkbutton with its info button beside it; all of them share _on_toggle
+            for row, (attr, text, active, on_toggle, on_info) in enumerate(rows):
+                checkbutton = self.widget_factory.create_checkbutton(
+                    settings_grid, text, active, self._on_toggle, x=0, y=row)
+                setattr(self, attr, checkbutton)
+                self._toggle_handlers[checkbutton] = on_toggle
+                self.widget_factory.create_info_button(settings_grid, on_info, x=1, y=row)
+
+            self.remember_window_size_checkbutton.set_margin_end(5)
             self.apply_on_boot_checkbutton.set_sensitive(False)  # Start disabled, will be enabled by settings applier if appropriate
 
-            # Create the info button for the Apply On Boot checkbutton
-            info_button_apply_boot = self.widget_factory.create_info_button(
-                settings_fixed, self.apply_boot_info_window, x=200, y=70)
-
-            # Create the Dark Mode toggle checkbutton
-            self.dark_mode_checkbutton = self.widget_factory.create_checkbutton(
-                settings_fixed, "Dark Mode", self.get_current_theme_preference(), self.on_dark_mode_toggle, x=5, y=100)
-
-            # Create the info button for the Dark Mode checkbutton
-            info_button_dark_mode = self.widget_factory.create_info_button(
-                settings_fixed, self.dark_mode_info_window, x=200, y=100)
-
-            # Create the Remember Window Size toggle checkbutton
-            self.remember_window_size_checkbutton = self.widget_factory.create_checkbutton(
-                settings_fixed, "Remember Window Size", self.get_current_window_size_preference(), self.on_remember_window_size_toggle, x=5, y=130, margin_end=5)
-
-            # Create the info button for the Remember Window Size checkbutton
-            info_button_window_size = self.widget_factory.create_info_button(
-                settings_fixed, self.window_size_info_window, x=200, y=130)
-
-            # Create the update interval label and spinbutton
-            interval_label = self.widget_factory.create_label(
-                settings_fixed, "Update Interval Seconds:", x=23, y=200)
+            # Create the update interval spinbutton with its label below it, spanning both columns
+            row = len(rows)
             interval_spinbutton = self.widget_factory.create_spinbutton(
-                settings_fixed, self.cpu_manager.update_interval, 0.1, 20.0, 0.1, 1, 0.1, 1, self.on_interval_changed, x=50, y=165, margin_bottom=10)
+                None, self.cpu_manager.update_interval, 0.1, 20.0, 0.1, 1, 0.1, 1, self.on_interval_changed, margin_top=4)
+            interval_spinbutton.set_halign(Gtk.Align.CENTER)
+            settings_grid.attach(interval_spinbutton, 0, row, 2, 1)
+            interval_label = self.widget_factory.create_label(None, "Update Interval Seconds:", margin_bottom=10)
+            interval_label.set_halign(Gtk.Align.CENTER)
+            settings_grid.attach(interval_label, 0, row + 1, 2, 1)
 
             # Adjust window size to fit content properly
             self.settings_window.set_default_size(230, 230)
@@ -139,6 +156,12 @@ class SettingsWindow:
         except Exception as e:
             self.logger.error(f"Error setting up settings window GUI: {e}")
 
+    def _on_toggle(self, checkbutton):
+        # Dispatch a toggled signal to the handler registered for that checkbutton
+        handler = self._toggle_handlers.get(checkbutton)
+        if handler is not None:
+            handler(checkbutton)
+
     def add_settings_widgets_to_gui_components(self):
         # Add the settings widgets to the gui_components dictionary
         try:
@@ -151,88 +174,66 @@ class SettingsWindow:
         except Exception as e:
             self.logger.error(f"Error adding settings_window widgets to gui_components: {e}")
 
-    def scale_info_window(self, widget):
-        # Show the information dialog for the Disable Scale Limits checkbutton
+    def _show_info(self, key, text, button_margin=126, width=300):
+        # Show the information dialog for key, building it on first use and reusing it afterwards
         try:
-            info_window = self.widget_factory.create_window("Information", self.settings_window, 300, 50)
-            info_box = self.widget_factory.create_box(info_window)
-            info_label = self.widget_factory.create_label(
-                info_box,
-                "Enabling this option allows setting CPU speeds beyond standard limits.\n"
-                "Note: values outside your CPU's allowed range may not work as expected.",
-                margin_start=10, margin_end=10, margin_top=10, margin_bottom=10)
-
-            def on_destroy(widget):
-                info_window.close()
-
-            info_button = self.widget_factory.create_button(
-                info_box, "OK", margin_start=164, margin_end=164, margin_bottom=10)
-            info_button.connect("clicked", on_destroy)
-            info_window.connect("close-request", on_destroy)
-
+            info_window = self._info_windows.get(key)
+            if info_window is None:
+                factory = self.widget_factory
+                info_window = factory.create_window("Information", self.settings_window, width, 50)
+                info_box = factory.create_box(info_window)
+                factory.create_label(
+                    info_box, text, margin_start=10, margin_end=10, margin_top=10, margin_bottom=10)
+                info_button = factory.create_button(
+                    info_box, "OK", margin_start=button_margin, margin_end=button_margin, margin_bottom=10)
+                info_button.connect("clicked", self._on_info_ok_clicked, info_window)
+                info_window.connect("close-request", self._on_info_close_request)
+                self._info_windows[key] = info_window
             info_window.present()
         except Exception as e:
-            self.logger.error(f"Error showing Disable Scale Limits info window: {e}")
+            self.logger.error(f"Error showing {key} info window: {e}")
 
-    def mhz_to_ghz_info_window(self, widget):
-        # Show the information dialog for the MHz to GHz checkbutton
-        try:
-            info_window = self.widget_factory.create_window("Information", self.settings_window, 300, 50)
-            info_box = self.widget_factory.create_box(info_window)
-            info_label = self.widget_factory.create_label(
-                info_box,
-                "Enabling this option will display labels in GHz instead of MHz",
-                margin_start=10, margin_end=10, margin_top=10, margin_bottom=10)
+    def _on_info_ok_clicked(self, button, info_window):
+        info_window.hide()
 
-            def on_destroy(widget):
-                info_window.close()
+    def _on_info_close_request(self, info_window):
+        # Hide instead of destroying so the dialog can be shown again
+        info_window.hide()
+        return True
 
-            info_button = self.widget_factory.create_button(
-                info_box, "OK", margin_start=126, margin_end=126, margin_bottom=10)
-            info_button.connect("clicked", on_destroy)
-            info_window.connect("close-request", on_destroy)
+    def scale_info_window(self, widget):
+        # Show the information dialog for the Disable Scale Limits checkbutton
+        self._show_info(
+            'scale_limits',
+            "Enabling this option allows setting CPU speeds beyond standard limits.\n"
+            "Note: values outside your CPU's allowed range may not work as expected.", 164)
 
-            info_window.present()
-        except Exception as e:
-            self.logger.error(f"Error showing MHz to GHz info window: {e}")
+    def mhz_to_ghz_info_window(self, widget):
+        # Show the information dialog for the MHz to GHz checkbutton
+        self._show_info('display_ghz', "Enabling this option will display labels in GHz instead of MHz")
 
     def apply_boot_info_window(self, widget):
         # Show the information dialog for the Apply On Boot checkbutton
-        try:
-            info_window = self.widget_factory.create_window("Information", self.settings_window, 350, 50)
-            info_box = self.widget_factory.create_box(info_window)
-            
-            # Check if systemd is available to show appropriate message
-            if hasattr(self.settings_applier, 'systemd_compatible') and not self.settings_applier.systemd_compatible:
-                info_text = ("Apply On Boot is not available on this system.\n\n"
-                           "This feature requires systemd, but your system is using\n"
-                           "a different init system (such as OpenRC, SysV init, etc.).\n\n"
-                           "You will need to manually apply your settings after each reboot.")
-            else:
-                info_text = ("Enabling this option will apply the settings you have specifically\n"
-                           "changed on boot with a systemd service and a complimentary script.\n"
-                           "Disabling this option will disable and delete the files.\n\n"
-                           "Note: You must first apply settings before this option becomes available.")
-            
-            info_label = self.widget_factory.create_label(
-                info_box,
-                info_text,
-                margin_start=10, margin_end=10, margin_top=10, margin_bottom=10)
-
-            def on_destroy(widget):
-                info_window.close()
-
-            info_button = self.widget_factory.create_button(
-                info_box, "OK", margin_start=147, margin_end=147, margin_bottom=10)
-            info_button.connect("clicked", on_destroy)
-            info_window.connect("close-request", on_destroy)
-
-            info_window.present()
-        except Exception as e:
-            self.logger.error(f"Error showing Apply On Boot info window: {e}")
+        # Check if systemd is available to show appropriate message
+        systemd_compatible = getattr(self.settings_applier, 'systemd_compatible', True)
+        if not systemd_compatible:
+            info_text = ("Apply On Boot is not available on this system.\n\n"
+                       "This feature requires systemd, but your system is using\n"
+                       "a different init system (such as OpenRC, SysV init, etc.).\n\n"
+                       "You will need to manually apply your settings after each reboot.")
+        else:
+            info_text = ("Enabling this option will apply the settings you have specifically\n"
+                       "changed on boot with a systemd service and a complimentary script.\n"
+                       "Disabling this option will disable and delete the files.\n\n"
+                       "Note: You must first apply settings before this option becomes available.")
+        self._show_info(('apply_on_boot', systemd_compatible), info_text, 147, width=350)
 
     def on_mhz_to_ghz_toggle(self, checkbutton):
-        self.global_state.display_ghz = checkbutton.get_active()
+        # Programmatic set_active calls can emit toggled without a change
+        display_ghz = checkbutton.get_active()
+        if display_ghz == self.global_state.display_ghz:
+            return
+        self.global_state.display_ghz = display_ghz
         self.cpu_manager.update_clock_speeds()
         self.widget_factory.update_frequency_scale_labels()
         
@@ -240,13 +241,17 @@ class SettingsWindow:
         if hasattr(self.main_app, 'update_frequency_display_units'):
             self.main_app.update_frequency_display_units()
             
-        self.config_manager.set_setting('Settings', 'display_ghz', str(self.global_state.display_ghz))
+        self._save_setting('Settings', 'display_ghz', str(self.global_state.display_ghz))
 
     def init_display_ghz_setting(self):
         display_ghz_setting = self.config_manager.get_setting('Settings', 'display_ghz', 'False')
-        self.global_state.display_ghz = display_ghz_setting == 'True'
-        self.widget_factory.update_frequency_scale_labels()
-        self.mhz_to_ghz_checkbutton.set_active(self.global_state.display_ghz)
+        display_ghz = display_ghz_setting == 'True'
+        if display_ghz != self.global_state.display_ghz:
+            self.global_state.display_ghz = display_ghz
+            self.widget_factory.update_frequency_scale_labels()
+        # The checkbutton is created from global_state when the window is first built
+        if self._built:
+            self.mhz_to_ghz_checkbutton.set_active(self.global_state.display_ghz)
 
     def on_apply_on_boot_toggle(self, checkbutton):
         """Handle Apply On Boot checkbutton toggle with improved error handling"""
@@ -282,13 +287,20 @@ class SettingsWindow:
             self.global_state.ignore_boot_checkbutton_toggle = False
 
     def on_interval_changed(self, spinbutton):
-        # Update the interval value when the spinbutton value changes
-        new_interval = round(spinbutton.get_value(), 1)
+        # Coalesce rapid spinbutton changes and apply only the latest value
+        if self._interval_source_id:
+            GLib.source_remove(self._interval_source_id)
+        self._interval_source_id = GLib.timeout_add(
+            self.INTERVAL_APPLY_DELAY_MS, self._apply_interval, round(spinbutton.get_value(), 1))
+
+    def _apply_interval(self, new_interval):
+        # Update the interval value once the spinbutton has settled
+        self._interval_source_id = 0
         self.cpu_manager.set_update_interval(new_interval)
         self.process_manager.set_update_interval(new_interval)
         
         # Save the new interval to config
-        self.config_manager.set_setting('Settings', 'update_interval', str(new_interval))
+        self._save_setting('Settings', 'update_interval', str(new_interval))
         
         # Restart memory and disk tasks with new interval
         if hasattr(self.main_app, 'task_scheduler') and hasattr(self.main_app, 'memory_manager'):
@@ -299,75 +311,100 @@ class SettingsWindow:
             # Reschedule with new interval
             self.main_app.schedule_memory_tasks()
             self.main_app.schedule_disk_tasks()
+        return False
+
+    def _save_setting(self, section, option, value):
+        # Update the setting in memory and write the config file off the main thread once idle
+        self.config_manager.set_setting(section, option, value, save=False)
+        if not self._config_save_source_id:
+            self._config_save_source_id = GLib.idle_add(self._flush_settings)
+
+    def _flush_settings(self):
+        self._config_save_source_id = 0
+        try:
+            self.config_manager.save_config_async()
+        except Exception as e:
+            self.logger.error(f"Error saving settings: {e}")
+        return False
+
+    def _get_gtk_settings(self):
+        # Return the default GtkSettings, caching it after the first lookup
+        if self._gtk_settings is None:
+            self._gtk_settings = Gtk.Settings.get_default()
+        return self._gtk_settings
 
     def get_current_theme_preference(self):
         # Get the current theme preference from config
         try:
             # Use the same config key as main application for consistency
             dark_mode_setting = self.config_manager.get_setting('UI', 'prefer_dark_theme', 'false')
-            return dark_mode_setting.lower() == 'true'
+            return _STR_TO_BOOL.get(dark_mode_setting.lower(), False)
         except Exception as e:
             self.logger.error(f"Error getting dark mode setting: {e}")
             return False
 
     def on_dark_mode_toggle(self, checkbutton):
-        # Toggle between light and dark themes
+        # Toggle between light and dark themes once the checkbutton has finished its own update
+        try:
+            if self._dark_mode_source_id:
+                GLib.source_remove(self._dark_mode_source_id)
+            self._dark_mode_source_id = GLib.idle_add(self._apply_dark_mode, checkbutton.get_active())
+        except Exception as e:
+            self.logger.error(f"Error toggling dark mode: {e}")
+
+    def _apply_dark_mode(self, is_dark):
+        # Apply the latest dark mode choice from an idle callback
+        self._dark_mode_source_id = 0
         try:
-            is_dark = checkbutton.get_active()
-            
             # Set the theme preference on default settings
-            settings = Gtk.Settings.get_default()
+            settings = self._get_gtk_settings()
             settings.set_property("gtk-application-prefer-dark-theme", is_dark)
             
             # Save the preference to config (use same key as main application)
-            self.config_manager.set_setting('UI', 'prefer_dark_theme', str(is_dark).lower())
+            self._save_setting('UI', 'prefer_dark_theme', _BOOL_TO_STR[is_dark])
             
             # Note: Graphs will automatically update on next redraw cycle
             
         except Exception as e:
             self.logger.error(f"Error toggling dark mode: {e}")
+        return False
 
     def refresh_all_graphs(self):
         # Force all CPU graphs to redraw with new theme colors
         try:
-            if 'cpu_graphs' in self.gui_components:
-                for graph in self.gui_components['cpu_graphs'].values():
-                    graph.queue_draw()
-            
-            if 'avg_usage_graph' in self.gui_components:
-                self.gui_components['avg_usage_graph'].queue_draw()
+            # Each drawing area has to be invalidated itself; queue_draw on a parent
+            # reuses the children's cached render nodes without re-running their draw funcs
+            cpu_graphs = self.gui_components['cpu_graphs'] or {}
+            if self._graph_drawables is None or self._graph_drawables_count != len(cpu_graphs):
+                drawables = list(cpu_graphs.values())
+                avg_usage_graph = self.gui_components['avg_usage_graph']
+                if avg_usage_graph is not None:
+                    drawables.append(avg_usage_graph)
+                self._graph_drawables = tuple(drawables)
+                self._graph_drawables_count = len(cpu_graphs)
+
+            for graph in self._graph_drawables:
+                graph.queue_draw()
                 
         except Exception as e:
             self.logger.error(f"Error refreshing graphs: {e}")
 
     def dark_mode_info_window(self, widget):
         # Show the information dialog for the Dark Mode checkbutton
-        try:
-            info_window = self.widget_factory.create_window("Information", self.settings_window, 300, 50)
-            info_box = self.widget_factory.create_box(info_window)
-            info_label = self.widget_factory.create_label(
-                info_box,
-                "Toggle between light and dark theme for the entire application.\n"
-                "CPU graphs will automatically adapt to match the selected theme.",
-                margin_start=10, margin_end=10, margin_top=10, margin_bottom=10)
-
-            def on_destroy(widget):
-                info_window.close()
-
-            info_button = self.widget_factory.create_button(
-                info_box, "OK", margin_start=126, margin_end=126, margin_bottom=10)
-            info_button.connect("clicked", on_destroy)
-            info_window.connect("close-request", on_destroy)
-
-            info_window.present()
-        except Exception as e:
-            self.logger.error(f"Error showing Dark Mode info window: {e}")
+        self._show_info(
+            'dark_mode',
+            "Toggle between light and dark theme for the entire application.\n"
+            "CPU graphs will automatically adapt to match the selected theme.")
 
     def init_dark_mode_setting(self):
         # Initialize the dark mode setting on startup
         try:
+            # Nothing to sync until the window is built; _ensure_built calls this again
+            if not self._built:
+                return
+
             # Get the current GTK theme state (which main app has already set)
-            settings = Gtk.Settings.get_default()
+            settings = self._get_gtk_settings()
             current_gtk_dark = settings.get_property("gtk-application-prefer-dark-theme")
             
             # Update the checkbutton to match the current GTK theme state
@@ -382,7 +419,7 @@ class SettingsWindow:
         """Get the current window size remembering preference from config"""
         try:
             remember_size_setting = self.config_manager.get_setting('UI', 'remember_window_size', 'true')
-            return remember_size_setting.lower() == 'true'
+            return _STR_TO_BOOL.get(remember_size_setting.lower(), False)
         except Exception as e:
             self.logger.error(f"Error getting window size preference: {e}")
             return True  # Default to enabled
@@ -393,7 +430,7 @@ class SettingsWindow:
             remember_size = checkbutton.get_active()
             
             # Save the preference to config
-            self.config_manager.set_setting('UI', 'remember_window_size', str(remember_size).lower())
+            self._save_setting('UI', 'remember_window_size', _BOOL_TO_STR[remember_size])
             
             self.logger.info(f"Window size remembering {'enabled' if remember_size else 'disabled'}")
             
@@ -402,24 +439,8 @@ class SettingsWindow:
 
     def window_size_info_window(self, widget):
         """Show the information dialog for the Remember Window Size checkbutton"""
-        try:
-            info_window = self.widget_factory.create_window("Information", self.settings_window, 300, 50)
-            info_box = self.widget_factory.create_box(info_window)
-            info_label = self.widget_factory.create_label(
-                info_box,
-                "When enabled, the application will remember the window size\n"
-                "you set and restore it the next time you open the application.\n"
-                "When disabled, the application will always start with the default size.",
-                margin_start=10, margin_end=10, margin_top=10, margin_bottom=10)
-
-            def on_destroy(widget):
-                info_window.close()
-
-            info_button = self.widget_factory.create_button(
-                info_box, "OK", margin_start=126, margin_end=126, margin_bottom=10)
-            info_button.connect("clicked", on_destroy)
-            info_window.connect("close-request", on_destroy)
-
-            info_window.present()
-        except Exception as e:
-            self.logger.error(f"Error showing Remember Window Size info window: {e}")
\ No newline at end of file
+        self._show_info(
+            'remember_window_size',
+            "When enabled, the application will remember the window size\n"
+            "you set and restore it the next time you open the application.\n"
+            "When disabled, the application will always start with the default size.")
\ No newline at end of file
@@ -17,7 +17,57 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import os
-import json
+import pickle
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from types import MappingProxyType
+
+# Bumped whenever the layout of the cached paths changes, so stale caches are rediscovered
+CACHE_FORMAT_VERSION = 1
+
+# Upper bound on worker threads used for per-thread file discovery
+MAX_DISCOVERY_WORKERS = 32
+
+# Canonical sysfs directory holding the per-CPU cpuN directories
+CPU_SYSFS_PATH = '/sys/devices/system/cpu'
+
+# cpufreq files looked up for every thread, keyed by their cpu_files entry
+CPUFREQ_FILE_PATHS = MappingProxyType({
+    'governor_files': "scaling_governor",
+    'speed_files': "scaling_cur_freq",
+    'scaling_max_files': "scaling_max_freq",
+    'scaling_min_files': "scaling_min_freq",
+    'cpuinfo_max_files': "cpuinfo_max_freq",
+    'cpuinfo_min_files': "cpuinfo_min_freq",
+    'available_governors_files': "scaling_available_governors",
+    'boost_files': "boost"
+})
+CPUFREQ_FILE_NAMES = frozenset(CPUFREQ_FILE_PATHS.values())
+
+# Class directory linking to every registered hwmon sensor chip
+HWMON_CLASS_PATH = '/sys/class/hwmon'
+
+# Canonical location of the RAPL power capping zones, and the device tree it links into
+POWERCAP_CLASS_PATH = '/sys/class/powercap'
+POWERCAP_DEVICES_PATH = '/sys/devices/virtual/powercap'
+
+# Substrings matched against thermal zone types and sensor labels; fixed for the process lifetime
+_INTEL_ZONE_PATTERNS = ('package', 'cpu', 'coretemp', 'x86_pkg_temp')
+_AMD_ZONE_PATTERNS = ('tctl', 'tccd', 'k10temp')
+_ARM_ZONE_PATTERNS = ('cpu', 'cluster', 'soc')
+_GENERIC_ZONE_PATTERNS = ('cpu', 'processor', 'core')
+_INTEL_LABEL_PATTERNS = ('package', 'cpu', 'coretemp', 'core')
+_AMD_LABEL_PATTERNS = ('tctl', 'tccd', 'k10temp', 'amdgpu')
+_OTHER_LABEL_PATTERNS = ('cpu', 'cluster', 'soc', 'thermal', 'core')
+
+# Name fragments and suffixes of candidate temperature files
+_TEMP_FILE_PATTERNS = ('temp', 'thermal')
+_TEMP_FILE_SUFFIXES = ('_input', '_temp', '_temperature')
+
+# Path fragments that mark a temperature file as CPU-related
+_CPU_PATH_PATTERNS_RE = re.compile(r'cpu|coretemp|package|tctl|tccd|k10temp|thermal/cpu|cpu_thermal|cluster|soc|tsens')
 
 class DirectoryCache:
     def __init__(self, logger):
@@ -29,7 +79,7 @@ class DirectoryCache:
 
         # Cache directory and file name
         self.cache_dir_path = os.path.join(os.path.expanduser("~"), ".cache", "LinuxVitals")
-        self.cache_file_path = os.path.join(self.cache_dir_path, "directory_cache.json")
+        self.cache_file_path = os.path.join(self.cache_dir_path, "directory_cache.pkl")
 
         # Ensure the cache directory exists
         self.ensure_cache_directory()
@@ -43,19 +93,31 @@ class DirectoryCache:
 
     def save_directories_to_file(self, directories):
         # Save the discovered directories and file paths to the cache file
+        # The cache is written beside the target and renamed over it, so an interrupted write never
+        # leaves a truncated cache behind. No fsync: losing the cache only costs a rediscovery.
+        tmp_path = self.cache_file_path + '.tmp'
         try:
-            with open(self.cache_file_path, 'w') as cache_file:
-                json.dump(directories, cache_file)
+            with open(tmp_path, 'wb') as cache_file:
+                pickle.dump({'version': CACHE_FORMAT_VERSION, 'directories': directories},
+                            cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_file_path)
         except Exception as e:
             self.logger.error(f"Failed to save directories and file paths: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
     def load_directories_from_file(self):
         # Load the discovered directories and file paths from the cache file
         try:
-            if os.path.exists(self.cache_file_path):
-                with open(self.cache_file_path, 'r') as cache_file:
-                    directories = json.load(cache_file)
-                    return directories
+            with open(self.cache_file_path, 'rb') as cache_file:
+                cached = pickle.load(cache_file)
+            if isinstance(cached, dict) and cached.get('version') == CACHE_FORMAT_VERSION:
+                return cached['directories']
+            self.logger.info("Ignoring directory cache written by a different version")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.logger.error(f"Failed to load directories and file paths: {e}")
         return None
@@ -72,13 +134,16 @@ class DirectoryCache:
         # Clear the cache
         self.cache = {}
 
-    def cached_directory_walk(self, base_path):
+    def cached_directory_walk(self, base_path, max_depth=None, strategy='dfs'):
         # Generator function that walks through directories using caching
-        stack = [base_path]
-        seen_paths = set()  # To track paths and avoid loops
+        # With max_depth set, directories deeper than max_depth levels below base_path are not entered
+        # strategy='bfs' yields shallow directories first, for callers that stop at the first match
+        stack = deque([(base_path, 0)])
+        pop = stack.popleft if strategy == 'bfs' else stack.pop
+        seen_paths = set()  # Paths already yielded
 
         while stack:
-            path = stack.pop()
+            path, depth = pop()
             if path in seen_paths:
                 continue
             seen_paths.add(path)
@@ -91,12 +156,14 @@ class DirectoryCache:
             try:
                 subdirs, files = [], []
                 with os.scandir(path) as scanner:
+                    # sysfs, procfs and the usual local filesystems report an accurate d_type, so
+                    # is_dir answers from the directory listing without a stat per entry. Symlinks
+                    # are never followed, so the walk cannot loop and needs no inode bookkeeping.
                     for entry in scanner:
                         if entry.is_dir(follow_symlinks=False):
-                            full_path = entry.path
-                            if os.path.realpath(full_path) not in seen_paths:
-                                subdirs.append(entry.name)
-                                stack.append(full_path)
+                            subdirs.append(entry.name)
+                            if max_depth is None or depth < max_depth:
+                                stack.append((entry.path, depth + 1))
                         else:
                             files.append(entry.name)
                 self.add(path, subdirs, files)
@@ -123,17 +190,9 @@ class CPUFileSearch:
         # CPU directory path
         self.cpu_directory = None
 
-        # File paths for various CPU files
-        self.cpufreq_file_paths = {
-            'governor_files': "scaling_governor",
-            'speed_files': "scaling_cur_freq",
-            'scaling_max_files': "scaling_max_freq",
-            'scaling_min_files': "scaling_min_freq",
-            'cpuinfo_max_files': "cpuinfo_max_freq",
-            'cpuinfo_min_files': "cpuinfo_min_freq",
-            'available_governors_files': "scaling_available_governors",
-            'boost_files': "boost"
-        }
+        # File paths for various CPU files, shared read-only across instances
+        self.cpufreq_file_paths = CPUFREQ_FILE_PATHS
+        self.cpufreq_file_names = CPUFREQ_FILE_NAMES
 
         # Path for package throttle time files
         self.package_throttle_time_file = "package_throttle_total_time_ms"
@@ -147,7 +206,13 @@ class CPUFileSearch:
         self.intel_boost_path = None
 
         # Path to the package temperature file
-        self.package_temp_file = None
+        self._package_temp_file = None
+
+        # Location of energy_perf_bias relative to a thread's power directory, found from cpu0
+        self._epb_relative_path = None
+
+        # Set when the package temperature file still has to be searched for
+        self._thermal_search_pending = False
 
         # Dictionary to hold paths to /proc files
         self.proc_files = {'stat': None, 'cpuinfo': None, 'meminfo': None}
@@ -158,6 +223,13 @@ class CPUFileSearch:
         # Dictionary to hold cache size files
         self.cache_files = {}
 
+        # Cache contents as loaded from disk, before validation
+        self._raw_cache = None
+
+        # Results of _is_cpu_related_thermal and contents of sensor label files, kept for the discovery pass
+        self._thermal_type_cache = {}
+        self._label_cache = {}
+
         # Load paths from cache
         cached_directories = self.directory_cache.load_directories_from_file()
         if cached_directories:
@@ -167,10 +239,14 @@ class CPUFileSearch:
 
     def load_paths_from_cache(self, cached_directories):
         # Load cached paths for various CPU files
+        # Keep the loaded cache so a reinitialization after failed validation can reuse its valid paths
+        self._raw_cache = cached_directories
         try:
             self.cpu_directory = cached_directories.get("cpu_directory")
             self.intel_boost_path = cached_directories.get("intel_boost_path")
             self.package_temp_file = cached_directories.get("package_temp_file")
+            # A cache saved before the deferred thermal search ran has no package_temp_file key
+            self._thermal_search_pending = "package_temp_file" not in cached_directories
             self.proc_files = cached_directories.get("proc_files", {})
             self.intel_tdp_files = cached_directories.get("intel_tdp_files", {})
             self.cache_files = cached_directories.get("cache_files", {})
@@ -181,14 +257,7 @@ class CPUFileSearch:
             for key in ['scaling_max_files', 'scaling_min_files', 'speed_files', 'governor_files', 
                         'cpuinfo_max_files', 'cpuinfo_min_files', 'available_governors_files', 
                         'boost_files', 'package_throttle_time_files', 'epb_files']:
-                if key in cpu_files:
-                    try:
-                        self.cpu_files[key] = {int(k): v for k, v in cpu_files[key].items()}
-                    except (ValueError, TypeError) as e:
-                        self.logger.warning(f"Invalid cache data for {key}: {e}")
-                        self.cpu_files[key] = {}
-                else:
-                    self.cpu_files[key] = {}
+                self.cpu_files[key] = cpu_files.get(key, {})
             
             self.cpu_type = "Intel" if self.intel_boost_path else "Other"
 
@@ -216,7 +285,8 @@ class CPUFileSearch:
             should_reinitialize = True
         
         # Package temperature file is optional, don't raise error for it
-        if not self.package_temp_file:
+        # Check the backing field so validation does not trigger a pending thermal search
+        if not self._package_temp_file and not self._thermal_search_pending:
             self.logger.info("Package temperature file is not set. This is common on some systems.")
         
         # If we encountered critical errors that would prevent proper functioning
@@ -225,14 +295,15 @@ class CPUFileSearch:
                 self.logger.error(error)
             self.logger.warning("Some essential CPU paths are missing, reinitializing...")
             # Clear the cache file to force reinitialization
-            if os.path.exists(self.directory_cache.cache_file_path):
-                try:
-                    os.remove(self.directory_cache.cache_file_path)
-                    self.logger.info("Removed invalid cache file to reinitialize paths")
-                except Exception as e:
-                    self.logger.error(f"Failed to remove cache file: {e}")
-            # Reinitialize files
-            self.initialize_cpu_files()
+            try:
+                os.remove(self.directory_cache.cache_file_path)
+                self.logger.info("Removed invalid cache file to reinitialize paths")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                self.logger.error(f"Failed to remove cache file: {e}")
+            # Reinitialize files, reusing the cached paths that are still valid
+            self.initialize_cpu_files(seed=self._raw_cache)
             # Check if critical paths are now available after reinitializing
             if not self.cpu_directory or not any(self.cpu_files['scaling_max_files'].values()) or not self.proc_files['stat']:
                 self.logger.warning("Some CPU control features may not be available due to missing system files.")
@@ -245,7 +316,7 @@ class CPUFileSearch:
         try:
             # Set basic CPU directory fallback
             if not self.cpu_directory:
-                self.cpu_directory = "/sys/devices/system/cpu"
+                self.cpu_directory = CPU_SYSFS_PATH
             
             # Set basic proc/stat fallback (this should almost always exist)
             if not self.proc_files.get('stat'):
@@ -268,8 +339,10 @@ class CPUFileSearch:
         except Exception as e:
             self.logger.error(f"Error setting up fallback configuration: {e}")
 
-    def initialize_cpu_files(self):
+    def initialize_cpu_files(self, seed=None):
         # Initialize CPU files by discovering paths
+        # Paths from seed, a previously loaded cache, are reused instead of searched for while they still exist
+        seed = seed or {}
         try:
             # Find the CPU directory first
             self.cpu_directory = self.find_cpu_directory()
@@ -277,35 +350,88 @@ class CPUFileSearch:
                 self.logger.warning('CPU directory is not set.')
                 return
 
-            # Initialize the search for all necessary CPU files
-            for i in range(self.thread_count):
-                self.find_cpufreq_files(i)
-                self.find_thermal_throttle_files(i)
+            # Initialize the search for all necessary CPU files, scanning the threads' directories concurrently
+            if self.cpu_type == "Intel":
+                self._epb_relative_path = self._find_epb_relative_path()
+            with ThreadPoolExecutor(max_workers=min(MAX_DISCOVERY_WORKERS, self.thread_count)) as executor:
+                list(executor.map(self._find_thread_files, range(self.thread_count)))
             self.find_no_turbo_file()
-            self.find_proc_files()
-            self.find_thermal_file()
-            self.find_intel_tdp_files()
-            self.find_cache_files()
-            self.find_energy_perf_bias_files()
+
+            if self._paths_exist(seed.get("proc_files")):
+                self.proc_files = dict(seed["proc_files"])
+            else:
+                self.find_proc_files()
+
+            # The thermal search is the slowest step; unless seeded it runs on first use of package_temp_file
+            if self._paths_exist({'temp': seed.get("package_temp_file")}):
+                self.package_temp_file = seed["package_temp_file"]
+            else:
+                self._thermal_search_pending = True
+
+            if self.cpu_type == "Intel" and self._paths_exist(seed.get("intel_tdp_files")):
+                self.intel_tdp_files = dict(seed["intel_tdp_files"])
+            else:
+                self.find_intel_tdp_files()
+
+            if seed.get("cache_files"):
+                self.cache_files = dict(seed["cache_files"])
+            else:
+                self.find_cache_files()
 
             # Save the paths to the cache
-            directories_to_save = {
-                "cpu_directory": self.cpu_directory,
-                "cpu_files": self.cpu_files,
-                "intel_boost_path": self.intel_boost_path,
-                "package_temp_file": self.package_temp_file,
-                "proc_files": self.proc_files,
-                "intel_tdp_files": self.intel_tdp_files,
-                "cache_files": self.cache_files,
-            }
-            self.directory_cache.save_directories_to_file(directories_to_save)
+            self.save_paths_to_cache()
         except Exception as e:
             self.logger.error(f"Error initializing CPU files: {e}")
 
-    def find_cpu_directory(self, base_path='/sys/'):
-        # Find the CPU directory by scanning the base path
+    def save_paths_to_cache(self):
+        # Save the discovered paths to the cache file
+        directories_to_save = {
+            "cpu_directory": self.cpu_directory,
+            "cpu_files": self.cpu_files,
+            "intel_boost_path": self.intel_boost_path,
+            "proc_files": self.proc_files,
+            "intel_tdp_files": self.intel_tdp_files,
+            "cache_files": self.cache_files,
+        }
+        # Leave the key out until the thermal search has run, so the next launch still searches
+        if not self._thermal_search_pending:
+            directories_to_save["package_temp_file"] = self._package_temp_file
+        self.directory_cache.save_directories_to_file(directories_to_save)
+
+    @property
+    def package_temp_file(self):
+        # Path to the package temperature file, searched for on first use after a fresh discovery.
+        # That first use is the first read_package_temperature tick, so the search runs on the GTK main loop.
+        if self._thermal_search_pending:
+            self._thermal_search_pending = False
+            self.find_thermal_file()
+            self.save_paths_to_cache()
+        return self._package_temp_file
+
+    @package_temp_file.setter
+    def package_temp_file(self, path):
+        self._package_temp_file = path
+
+    def _paths_exist(self, paths):
+        # Check that a dict of cached paths is complete and every path still exists
+        return bool(paths) and all(path and os.path.exists(path) for path in paths.values())
+
+    def find_cpu_directory(self, base_path=CPU_SYSFS_PATH):
+        # Find the CPU directory, probing the canonical sysfs location before walking below it
+        try:
+            with os.scandir(base_path) as scanner:
+                children = {entry.name for entry in scanner if entry.is_dir()}
+            if 'intel_pstate' in children:
+                self.cpu_type = "Intel"
+                return base_path
+            if 'cpufreq' in children:
+                self.cpu_type = "Other"
+                return base_path
+        except OSError as e:
+            self.logger.info(f"Could not probe {base_path}: {e}")
+
         try:
-            for root, dirs, files in self.directory_cache.cached_directory_walk(base_path):
+            for root, dirs, files in self.directory_cache.cached_directory_walk(base_path, max_depth=3, strategy='bfs'):
                 if 'intel_pstate' in dirs and 'cpu' in root:
                     self.cpu_type = "Intel"
                     return root
@@ -317,36 +443,44 @@ class CPUFileSearch:
         self.logger.warning('CPU directory not found.')
         return None
 
+    def _find_thread_files(self, thread_index):
+        # Find the per-thread files; each worker only writes its own thread_index entries
+        self.find_cpufreq_files(thread_index)
+        self.find_thermal_throttle_files(thread_index)
+        self.find_energy_perf_bias_file(thread_index)
+
     def find_no_turbo_file(self):
         # Find the Intel no_turbo file if applicable
         try:
             if self.cpu_type == "Intel" and self.intel_boost_path is None:
                 intel_pstate_path = os.path.join(self.cpu_directory, 'intel_pstate')
-                for root, dirs, files in self.directory_cache.cached_directory_walk(intel_pstate_path):
-                    if 'no_turbo' in files:
-                        potential_path = os.path.join(root, 'no_turbo')
-                        self.intel_boost_path = potential_path
-                        self.cpu_files['boost_files'][0] = self.intel_boost_path
-                        return
+                # no_turbo sits directly in intel_pstate, so one directory listing is enough
+                try:
+                    _, files = self._scan_directory(intel_pstate_path)
+                except FileNotFoundError:
+                    files = set()
+                if 'no_turbo' in files:
+                    self.intel_boost_path = os.path.join(intel_pstate_path, 'no_turbo')
+                    self.cpu_files['boost_files'][0] = self.intel_boost_path
+                    return
                 self.logger.warning('Intel no_turbo file does not exist.')
         except Exception as e:
             self.logger.error(f"Error finding no_turbo file: {e}")
 
     def find_cpufreq_files(self, thread_index):
-        # Find cpufreq files for each CPU thread
+        # Find cpufreq files for each CPU thread; they all sit directly in the thread's cpufreq directory
         try:
             thread_cpufreq_directory = os.path.join(self.cpu_directory, f"cpu{thread_index}", "cpufreq")
-            found_files = 0
-            for root, dirs, files in self.directory_cache.cached_directory_walk(thread_cpufreq_directory):
-                for file_key, file_name in self.cpufreq_file_paths.items():
-                    if file_name in files:
-                        file_path = os.path.join(root, file_name)
-                        self.cpu_files[file_key][thread_index] = file_path
-                        found_files += 1
-                    if found_files == len(self.cpufreq_file_paths):
-                        return
+            try:
+                _, files = self._scan_directory(thread_cpufreq_directory)
+            except FileNotFoundError:
+                files = set()
 
-            if found_files < len(self.cpufreq_file_paths):
+            for file_key, file_name in self.cpufreq_file_paths.items():
+                if file_name in files:
+                    self.cpu_files[file_key][thread_index] = os.path.join(thread_cpufreq_directory, file_name)
+
+            if not self.cpufreq_file_names <= files:
                 for file_key, file_name in self.cpufreq_file_paths.items():
                     if not self.cpu_files[file_key].get(thread_index):
                         # Only log boost file as warning in debug mode, it's normal for it to be missing on ARM
@@ -363,49 +497,31 @@ class CPUFileSearch:
         try:
             if self.cpu_type == "Intel":
                 thread_thermal_throttle_directory = os.path.join(self.cpu_directory, f"cpu{thread_index}", "thermal_throttle")
-                file_found = False
-                for root, dirs, files in self.directory_cache.cached_directory_walk(thread_thermal_throttle_directory):
-                    if self.package_throttle_time_file in files:
-                        throttle_file_path = os.path.join(root, self.package_throttle_time_file)
-                        self.cpu_files['package_throttle_time_files'][thread_index] = throttle_file_path
-                        file_found = True
-                        break
-                if not file_found:
+                # The throttle counters sit directly in thermal_throttle, so one directory listing is enough
+                try:
+                    _, files = self._scan_directory(thread_thermal_throttle_directory)
+                except FileNotFoundError:
+                    files = set()
+                if self.package_throttle_time_file in files:
+                    throttle_file_path = os.path.join(thread_thermal_throttle_directory, self.package_throttle_time_file)
+                    self.cpu_files['package_throttle_time_files'][thread_index] = throttle_file_path
+                else:
                     self.logger.warning(f'Throttle file {self.package_throttle_time_file} for thread {thread_index} does not exist at {thread_thermal_throttle_directory}.')
                     
         except Exception as e:
             self.logger.error(f"Error finding thermal throttle files for thread {thread_index}: {e}")
 
     def find_proc_files(self, base_path='/proc/'):
-        # Find necessary /proc files
-        proc_file_names = ['stat', 'cpuinfo', 'meminfo']
-        need_to_find = set(proc_file_names)
-        try:
-            found_files = 0
-            for root, dirs, files in self.directory_cache.cached_directory_walk(base_path):
-                for file_name in list(need_to_find):
-                    if file_name in files:
-                        self.proc_files[file_name] = os.path.join(root, file_name)
-                        need_to_find.remove(file_name)
-                        found_files += 1
-                if found_files == len(proc_file_names):
-                    return
-
-            if found_files < len(proc_file_names):
-                for file_name in need_to_find:
-                    self.logger.warning(f'{file_name} file not found in /proc/')
-
-        except Exception as e:
-            self.logger.error(f"Error searching for proc files: {e}")
+        # Find necessary /proc files; they always sit directly in /proc, so no walk is needed
+        for file_name in ('stat', 'cpuinfo', 'meminfo'):
+            file_path = os.path.join(base_path, file_name)
+            if os.path.exists(file_path):
+                self.proc_files[file_name] = file_path
+            else:
+                self.logger.warning(f'{file_name} file not found in /proc/')
 
     def find_thermal_file(self):
         # Find CPU thermal files
-        potential_paths = [
-            '/sys/class/thermal/',  # Most common location for thermal zones
-            '/sys/class/',          # Fallback to broader search
-            '/sys/devices/',        # Your ARM device structure
-        ]
-        
         # Priority list for temperature files/sensors
         # Higher priority items are checked first
         cpu_sensor_priorities = [
@@ -440,21 +556,17 @@ class CPUFileSearch:
                 self.logger.info(f"Found thermal zone file: {thermal_zone_file}")
                 return
             
-            # If thermal zones don't work, search through device tree
-            for base_path in potential_paths:
-                if not os.path.exists(base_path):
-                    continue
-                    
-                # Search for temperature files
-                temp_files = self._search_temperature_files(base_path)
-                
-                if temp_files:
-                    # Sort by priority and select the best match
-                    best_file = self._select_best_thermal_file(temp_files, cpu_sensor_priorities)
-                    if best_file:
-                        self.package_temp_file = best_file
-                        self.logger.info(f"Found thermal file: {best_file}")
-                        return
+            # If thermal zones don't work, search the hwmon sensor chips; every hwmon driver,
+            # ARM ones included, registers its chip there, so the device tree is not walked
+            temp_files = self._search_temperature_files(HWMON_CLASS_PATH)
+            
+            if temp_files:
+                # Sort by priority and select the best match
+                best_file = self._select_best_thermal_file(temp_files, cpu_sensor_priorities)
+                if best_file:
+                    self.package_temp_file = best_file
+                    self.logger.info(f"Found thermal file: {best_file}")
+                    return
         
         except Exception as e:
             self.logger.error(f"Error finding thermal files: {e}")
@@ -465,66 +577,106 @@ class CPUFileSearch:
         """Find thermal zone file - most reliable method for most systems"""
         thermal_zone_base = '/sys/class/thermal/'
         
-        if not os.path.exists(thermal_zone_base):
-            return None
-        
         try:
-            # Look for thermal zones
-            for item in os.listdir(thermal_zone_base):
-                if item.startswith('thermal_zone'):
-                    zone_path = os.path.join(thermal_zone_base, item)
+            # Thermal zones are numbered from zero without gaps; stop at the first missing one
+            index = 0
+            while True:
+                zone_path = f'{thermal_zone_base}thermal_zone{index}'
+                index += 1
+                try:
+                    with open(os.path.join(zone_path, 'type'), 'r') as f:
+                        zone_type = f.read().strip().lower()
+                except FileNotFoundError:
+                    break
+                except (IOError, OSError):
+                    continue
+                
+                # Check if this thermal zone is CPU-related
+                if self._is_cpu_related_thermal(zone_type):
+                    # Verify the temperature file is readable
                     temp_file = os.path.join(zone_path, 'temp')
-                    type_file = os.path.join(zone_path, 'type')
-                    
-                    if os.path.exists(temp_file) and os.path.exists(type_file):
-                        try:
-                            with open(type_file, 'r') as f:
-                                zone_type = f.read().strip().lower()
-                                
-                            # Check if this thermal zone is CPU-related
-                            if self._is_cpu_related_thermal(zone_type):
-                                # Verify the temperature file is readable
-                                with open(temp_file, 'r') as f:
-                                    temp_value = f.read().strip()
-                                    if temp_value.isdigit():
-                                        return temp_file
-                        except (IOError, OSError):
-                            continue
+                    temp_value = self._read_int_or_none(temp_file)
+                    if temp_value is not None and temp_value >= 0:
+                        return temp_file
         
         except Exception as e:
             self.logger.info(f"Error searching thermal zones: {e}")
         
         return None
 
+    def _read_int_or_none(self, path):
+        """Read a sysfs integer with a single raw read, returning None if unreadable or not an integer"""
+        try:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                buf = os.read(fd, 32)
+            finally:
+                os.close(fd)
+        except OSError:
+            return None
+        return int(buf) if buf.strip().lstrip(b'-').isdigit() else None
+
+    def _sensor_directories(self, base_path):
+        """Yield (directory, file names) for each sensor chip linked from base_path, such as hwmonN"""
+        try:
+            with os.scandir(base_path) as scanner:
+                chip_paths = sorted(entry.path for entry in scanner)
+        except OSError:
+            return
+        
+        for chip_path in chip_paths:
+            # Resolve the class link so the device path (coretemp, k10temp, ...) takes part in matching
+            root = os.path.realpath(chip_path)
+            cached = self.directory_cache.get(root)
+            if cached:
+                yield root, cached['files']
+                continue
+            try:
+                subdirs, files = [], []
+                with os.scandir(root) as scanner:
+                    for entry in scanner:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        else:
+                            files.append(entry.name)
+            except OSError:
+                continue
+            self.directory_cache.add(root, subdirs, files)
+            yield root, files
+
     def _search_temperature_files(self, base_path):
         """Search for temperature files in the given path"""
         temp_files = []
         
         try:
-            for root, dirs, files in self.directory_cache.cached_directory_walk(base_path):
+            for root, files in self._sensor_directories(base_path):
                 # Look for various temperature file patterns
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    
-                    # Common temperature file patterns
-                    if any(pattern in file.lower() for pattern in ['temp', 'thermal']):
-                        if any(suffix in file for suffix in ['_input', '_temp', '_temperature']):
-                            # Check if file contains CPU-related info
-                            parent_dir = os.path.basename(root).lower()
-                            if self._is_cpu_related_path(root, file):
-                                try:
-                                    # Verify file is readable and contains valid temperature
-                                    with open(file_path, 'r') as f:
-                                        content = f.read().strip()
-                                        if content.isdigit() and int(content) > 0:
-                                            temp_files.append({
-                                                'path': file_path,
-                                                'root': root,
-                                                'file': file,
-                                                'parent_dir': parent_dir
-                                            })
-                                except (IOError, OSError, ValueError):
-                                    continue
+                candidates = [
+                    file for file in files
+                    if any(pattern in file.lower() for pattern in _TEMP_FILE_PATTERNS)
+                    and any(suffix in file for suffix in _TEMP_FILE_SUFFIXES)
+                ]
+                if not candidates:
+                    continue
+                
+                # Decide the directory-wide CPU evidence once for all of its candidates
+                file_names = set(files)
+                parent_dir = os.path.basename(root).lower()
+                dir_related = self._is_cpu_related_dir(root, file_names)
+                
+                for file in candidates:
+                    # Check if file contains CPU-related info
+                    if dir_related or self._is_cpu_related_path(root, file, file_names):
+                        # Verify file is readable and contains valid temperature
+                        file_path = os.path.join(root, file)
+                        value = self._read_int_or_none(file_path)
+                        if value is not None and value > 0:
+                            temp_files.append({
+                                'path': file_path,
+                                'root': root,
+                                'file': file,
+                                'parent_dir': parent_dir
+                            })
         
         except Exception as e:
             self.logger.info(f"Error searching temperature files in {base_path}: {e}")
@@ -533,65 +685,83 @@ class CPUFileSearch:
 
     def _is_cpu_related_thermal(self, zone_type):
         """Check if a thermal zone type is CPU-related"""
+        key = (self.cpu_type, zone_type)
+        result = self._thermal_type_cache.get(key)
+        if result is None:
+            result = self._thermal_type_cache[key] = self._match_cpu_related_thermal(zone_type)
+        return result
+
+    def _match_cpu_related_thermal(self, zone_type):
+        """Match a thermal zone type against the CPU-related patterns"""
         zone_type = zone_type.lower()
         
         # Intel/AMD patterns
         if self.cpu_type == "Intel":
-            return any(pattern in zone_type for pattern in ['package', 'cpu', 'coretemp', 'x86_pkg_temp'])
+            return any(pattern in zone_type for pattern in _INTEL_ZONE_PATTERNS)
         
         # AMD patterns
-        if 'amd' in zone_type or any(pattern in zone_type for pattern in ['tctl', 'tccd', 'k10temp']):
+        if 'amd' in zone_type or any(pattern in zone_type for pattern in _AMD_ZONE_PATTERNS):
             return True
         
         # ARM patterns
-        if any(pattern in zone_type for pattern in ['cpu', 'cluster', 'soc']):
+        if any(pattern in zone_type for pattern in _ARM_ZONE_PATTERNS):
             return True
         
         # Generic patterns
-        return any(pattern in zone_type for pattern in ['cpu', 'processor', 'core'])
+        return any(pattern in zone_type for pattern in _GENERIC_ZONE_PATTERNS)
 
-    def _is_cpu_related_path(self, root, file):
-        """Check if a file path is CPU-related"""
-        full_path = os.path.join(root, file).lower()
-        parent_dir = os.path.basename(root).lower()
-        
-        # Check for CPU-related patterns in the path
-        cpu_patterns = [
-            'cpu', 'coretemp', 'package', 'tctl', 'tccd', 'k10temp',
-            'thermal/cpu', 'cpu_thermal', 'cluster', 'soc', 'tsens'
-        ]
-        
-        # Check file content description if available
+    def _read_cached(self, path):
+        """Read a small sysfs text file once, returning its lowercased content or None"""
         try:
-            # Look for label or name files in the same directory
-            for label_file in ['label', 'name', 'type']:
-                label_path = os.path.join(root, file.replace('_input', f'_{label_file}'))
-                if os.path.exists(label_path):
-                    with open(label_path, 'r') as f:
-                        label_content = f.read().strip().lower()
-                        if self._is_cpu_related_thermal(label_content):
-                            return True
-            
-            # Check hwmon device name
-            if 'hwmon' in root:
-                name_file = os.path.join(root, 'name')
-                if os.path.exists(name_file):
-                    with open(name_file, 'r') as f:
-                        name_content = f.read().strip().lower()
-                        if self._is_cpu_related_thermal(name_content):
-                            return True
-        
-        except (IOError, OSError):
+            return self._label_cache[path]
+        except KeyError:
             pass
+        try:
+            with open(path, 'r') as f:
+                content = f.read().strip().lower()
+        except (IOError, OSError):
+            content = None
+        self._label_cache[path] = content
+        return content
+
+    def _is_cpu_related_dir(self, root, file_names):
+        """Check if a directory's hwmon device name or path marks all of its sensors as CPU-related"""
+        if 'hwmon' in root and 'name' in file_names:
+            name_content = self._read_cached(os.path.join(root, 'name'))
+            if name_content is not None and self._is_cpu_related_thermal(name_content):
+                return True
+        return _CPU_PATH_PATTERNS_RE.search(root.lower()) is not None
+
+    def _is_cpu_related_path(self, root, file, file_names=None):
+        """Check if a file path is CPU-related"""
+        # Look for label or name files in the same directory; with file_names given, only existing ones are read
+        for label_file in ['label', 'name', 'type']:
+            label_name = file.replace('_input', f'_{label_file}')
+            if file_names is not None and label_name not in file_names:
+                continue
+            label_content = self._read_cached(os.path.join(root, label_name))
+            if label_content is not None and self._is_cpu_related_thermal(label_content):
+                return True
+        
+        # Check hwmon device name
+        if 'hwmon' in root:
+            name_content = self._read_cached(os.path.join(root, 'name'))
+            if name_content is not None and self._is_cpu_related_thermal(name_content):
+                return True
         
-        # Check path components
-        return any(pattern in full_path for pattern in cpu_patterns)
+        # Check for CPU-related patterns in the path
+        return _CPU_PATH_PATTERNS_RE.search(os.path.join(root, file).lower()) is not None
 
     def _select_best_thermal_file(self, temp_files, priorities):
         """Select the best thermal file based on priority list"""
         if not temp_files:
             return None
         
+        # Weight each priority pattern once, higher score for higher priority, and collect the distinct
+        # substrings so each path is searched for every substring only once
+        weighted_priorities = [(pattern1, pattern2, len(priorities) - i) for i, (pattern1, pattern2) in enumerate(priorities)]
+        pattern_names = {pattern for pair in priorities for pattern in pair if pattern}
+        
         # Score each file based on priority patterns
         scored_files = []
         
@@ -599,14 +769,14 @@ class CPUFileSearch:
             score = 0
             path = file_info['path'].lower()
             parent_dir = file_info['parent_dir'].lower()
+            in_path = {pattern for pattern in pattern_names if pattern in path}
+            in_parent_dir = {pattern for pattern in in_path if pattern in parent_dir}
             
             # Check against priority list
-            for i, (pattern1, pattern2) in enumerate(priorities):
-                priority_score = len(priorities) - i  # Higher score for higher priority
-                
-                if pattern1 in path and (not pattern2 or pattern2 in path):
+            for pattern1, pattern2, priority_score in weighted_priorities:
+                if pattern1 in in_path and (not pattern2 or pattern2 in in_path):
                     score += priority_score * 2  # Bonus for exact match
-                elif pattern1 in parent_dir:
+                elif pattern1 in in_parent_dir:
                     score += priority_score
             
             # Bonus for commonly reliable patterns
@@ -641,14 +811,14 @@ class CPUFileSearch:
         
         # Intel patterns
         if self.cpu_type == 'Intel':
-            return any(pattern in label for pattern in ['package', 'cpu', 'coretemp', 'core'])
+            return any(pattern in label for pattern in _INTEL_LABEL_PATTERNS)
         
         # AMD patterns
-        if any(pattern in label for pattern in ['tctl', 'tccd', 'k10temp', 'amdgpu']):
+        if any(pattern in label for pattern in _AMD_LABEL_PATTERNS):
             return True
         
         # ARM and other patterns
-        return any(pattern in label for pattern in ['cpu', 'cluster', 'soc', 'thermal', 'core'])
+        return any(pattern in label for pattern in _OTHER_LABEL_PATTERNS)
 
     def find_intel_tdp_files(self):
         # Find Intel TDP files if applicable
@@ -660,21 +830,25 @@ class CPUFileSearch:
             'max_tdp': 'constraint_0_max_power_uw'
         }
         try:
-            for root, dirs, files in os.walk('/sys/'):
-                if 'intel-rapl:0' in root:
-                    cached = self.directory_cache.get(root)
-                    if not cached:
-                        self.directory_cache.add(root, dirs, files)
-                    else:
-                        files = cached['files']
-
-                    found_files = 0
-                    for key, file_name in tdp_file_names.items():
-                        if file_name in files:
-                            self.intel_tdp_files[key] = os.path.join(root, file_name)
-                            found_files += 1
-                    if found_files == len(tdp_file_names):
-                        return
+            # RAPL zones are linked from /sys/class/powercap; only the package 0 zone is needed
+            if os.path.isdir(POWERCAP_CLASS_PATH):
+                with os.scandir(POWERCAP_CLASS_PATH) as scanner:
+                    zone_paths = sorted(entry.path for entry in scanner if entry.name.startswith('intel-rapl:0'))
+                zones = (self._scan_directory(zone_path) for zone_path in zone_paths)
+            else:
+                zones = (
+                    (root, files) for root, dirs, files in self.directory_cache.cached_directory_walk(POWERCAP_DEVICES_PATH)
+                    if 'intel-rapl:0' in root
+                )
+
+            for root, files in zones:
+                found_files = 0
+                for key, file_name in tdp_file_names.items():
+                    if file_name in files:
+                        self.intel_tdp_files[key] = os.path.join(root, file_name)
+                        found_files += 1
+                if found_files == len(tdp_file_names):
+                    return
         except Exception as e:
             self.logger.error(f"Error finding Intel TDP control file: {e}")
 
@@ -682,44 +856,83 @@ class CPUFileSearch:
             if not path:
                 self.logger.warning(f'Intel {key} file not found.')
 
+    def _scan_directory(self, path):
+        # List a single directory with one scandir pass, adding it to the directory cache
+        cached = self.directory_cache.get(path)
+        if cached:
+            return path, set(cached['files'])
+        subdirs, files = [], []
+        with os.scandir(path) as scanner:
+            for entry in scanner:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                else:
+                    files.append(entry.name)
+        self.directory_cache.add(path, subdirs, files)
+        return path, set(files)
+
     def find_cache_files(self):
         # Find cache size files in the CPU directory
         if self.cpu_directory:
             base_path = os.path.join(self.cpu_directory, 'cpu0')  # Starting with cpu0 for simplicity
             cache_path = os.path.join(base_path, 'cache')
-            try:
-                for root, dirs, files in self.directory_cache.cached_directory_walk(cache_path):
-                    for dir_name in dirs:
-                        cache_index_path = os.path.join(root, dir_name)
-                        size_file = os.path.join(cache_index_path, 'size')
-                        level_file = os.path.join(cache_index_path, 'level')
-                        type_file = os.path.join(cache_index_path, 'type')
-                        if os.path.exists(size_file) and os.path.exists(level_file) and os.path.exists(type_file):
-                            with open(level_file, 'r') as lf, open(type_file, 'r') as tf, open(size_file, 'r') as sf:
-                                level = lf.read().strip()
-                                type_ = tf.read().strip()
-                                size = sf.read().strip()
-                                self.cache_files[f"{level}_{type_}"] = size
-            except Exception as e:
-                self.logger.error(f"Error searching cache directory: {e}")
+            # The kernel numbers cache indexes index0, index1, ... without gaps; stop at the first missing one
+            for index in count():
+                cache_index_path = os.path.join(cache_path, f"index{index}")
+                # Open the index directory once and read its attributes relative to it
+                try:
+                    dir_fd = os.open(cache_index_path, os.O_RDONLY | os.O_DIRECTORY)
+                except FileNotFoundError:
+                    break
+                except OSError as e:
+                    self.logger.error(f"Error searching cache directory: {e}")
+                    break
+                try:
+                    level = self._read_attr_at(dir_fd, 'level')
+                    type_ = self._read_attr_at(dir_fd, 'type')
+                    size = self._read_attr_at(dir_fd, 'size')
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    self.logger.error(f"Error reading cache index {cache_index_path}: {e}")
+                    continue
+                finally:
+                    os.close(dir_fd)
+                self.cache_files[f"{level}_{type_}"] = size
+
+    def _read_attr_at(self, dir_fd, name):
+        # Read a short sysfs attribute relative to an open directory
+        fd = os.open(name, os.O_RDONLY, dir_fd=dir_fd)
+        try:
+            return os.read(fd, 64).decode().strip()
+        finally:
+            os.close(fd)
 
-    def find_energy_perf_bias_files(self):
-        # Find energy_perf_bias files for each CPU thread
+    def find_energy_perf_bias_file(self, thread_index):
+        # Find the energy_perf_bias file for a CPU thread
         if self.cpu_type != "Intel":
             return
         
         try:
-            for i in range(self.thread_count):
-                thread_power_directory = os.path.join(self.cpu_directory, f"cpu{i}", "power")
-                found_files = 0
-                for root, dirs, files in self.directory_cache.cached_directory_walk(thread_power_directory):
-                    if 'energy_perf_bias' in files:
-                        file_path = os.path.join(root, 'energy_perf_bias')
-                        self.cpu_files['epb_files'][i] = file_path
-                        found_files += 1
-                        break
-                if found_files == 0:
-                    self.logger.warning(f'Intel energy_perf_bias file for thread {i} does not exist at {thread_power_directory}.')
+            thread_power_directory = os.path.join(self.cpu_directory, f"cpu{thread_index}", "power")
+            # Every thread's power directory has the same layout, so cpu0 is walked once and
+            # the location found there is checked directly for the other threads
+            if self._epb_relative_path is None:
+                self._epb_relative_path = self._find_epb_relative_path()
+            if self._epb_relative_path:
+                file_path = os.path.join(thread_power_directory, self._epb_relative_path)
+                if os.path.exists(file_path):
+                    self.cpu_files['epb_files'][thread_index] = file_path
+                    return
+            self.logger.warning(f'Intel energy_perf_bias file for thread {thread_index} does not exist at {thread_power_directory}.')
 
         except Exception as e:
-            self.logger.error(f"Error finding Intel energy_perf_bias files for threads: {e}")
+            self.logger.error(f"Error finding Intel energy_perf_bias file for thread {thread_index}: {e}")
+
+    def _find_epb_relative_path(self):
+        # Locate energy_perf_bias below cpu0's power directory, returning its relative path or ''
+        cpu0_power_directory = os.path.join(self.cpu_directory, "cpu0", "power")
+        for root, dirs, files in self.directory_cache.cached_directory_walk(cpu0_power_directory):
+            if 'energy_perf_bias' in files:
+                return os.path.relpath(os.path.join(root, 'energy_perf_bias'), cpu0_power_directory)
+        return ''
@@ -16,21 +16,119 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+from collections import deque
+
 import gi
 gi.require_version('Gtk', '4.0')
-from gi.repository import Gtk, Gdk
+gi.require_version('Pango', '1.0')
+gi.require_version('PangoCairo', '1.0')
+from gi.repository import Gtk, Gdk, Pango, PangoCairo
 import cairo
 
+# Number of usage samples kept and drawn, one per update
+HISTORY_LENGTH = 60
+
+# Distance of the drawn text from the tile edges (grid margin + label padding)
+TEXT_INSET = 7
+
+class GraphText:
+    """Label-like handle for one text slot drawn by a CPUGraphArea"""
+    __slots__ = ('_set_text', '_set_visible')
+
+    def __init__(self, set_text, set_visible=None):
+        self._set_text = set_text
+        self._set_visible = set_visible
+
+    def set_text(self, text):
+        self._set_text(text)
+
+    def set_visible(self, visible):
+        if self._set_visible is not None:
+            self._set_visible(visible)
+
 class CPUGraphArea(Gtk.DrawingArea):
+    # Bumped whenever the theme changes; the shared colors are recomputed when their copy is stale
+    _theme_generation = 0
+    _theme_watched = False
+    _shared_colors = None
+    _shared_colors_generation = -1
+
     def __init__(self, cpu_id):
         super().__init__()
         self.cpu_id = cpu_id
-        self.usage_history = [0] * 60  # Store 60 seconds of history
+        self.usage_history = deque([0] * HISTORY_LENGTH, maxlen=HISTORY_LENGTH)  # Store 60 seconds of history
+        self._equal_run = HISTORY_LENGTH  # Trailing samples equal to the newest one
         self.set_draw_func(self.draw)
         
         # Get style context for theme colors
         self.style_context = self.get_style_context()
+        self._watch_theme()
         
+        # Text drawn over the graph; tiles that keep label widgets leave these unset
+        self.header_text = None
+        self.clock_text = None
+        self.usage_text = None
+        self.clock_visible = True
+        self._layouts = None
+        
+        # Background and outline rendered once, valid for _background_key (size, scale and theme)
+        self._background = None
+        self._background_key = None
+        
+        # x coordinate of each history sample, valid for _x_width
+        self._x_positions = None
+        self._x_width = None
+        
+    def set_header_text(self, text):
+        if text != self.header_text:
+            self.header_text = text
+            self.queue_draw()
+    
+    def set_clock_text(self, text):
+        if text != self.clock_text:
+            self.clock_text = text
+            self.queue_draw()
+    
+    def set_clock_visible(self, visible):
+        if visible != self.clock_visible:
+            self.clock_visible = visible
+            self.queue_draw()
+    
+    def set_usage_text(self, text):
+        if text != self.usage_text:
+            self.usage_text = text
+            self.queue_draw()
+    
+    def clock_handle(self):
+        return GraphText(self.set_clock_text, self.set_clock_visible)
+    
+    def usage_handle(self):
+        return GraphText(self.set_usage_text)
+        
+    @classmethod
+    def _watch_theme(cls):
+        # Connect once, for all graphs, to the settings that switch the theme
+        if cls._theme_watched:
+            return
+        settings = Gtk.Settings.get_default()
+        if settings is None:
+            return
+        settings.connect('notify::gtk-application-prefer-dark-theme', cls._on_theme_changed)
+        settings.connect('notify::gtk-theme-name', cls._on_theme_changed)
+        cls._theme_watched = True
+
+    @classmethod
+    def _on_theme_changed(cls, settings, pspec):
+        cls._theme_generation += 1
+
+    def _get_colors(self):
+        # Return the theme colors shared by all graphs; the first graph drawn after a theme change looks them up
+        cls = CPUGraphArea
+        if cls._shared_colors_generation != cls._theme_generation:
+            cls._shared_colors = self.get_theme_colors()
+            cls._shared_colors_generation = cls._theme_generation
+        return cls._shared_colors
+
     def get_theme_colors(self):
         try:
             # Get colors from the current GTK theme
@@ -81,44 +179,116 @@ class CPUGraphArea(Gtk.DrawingArea):
                 'outline': (0.3, 0.3, 0.3)
             }
 
+    def _get_layouts(self):
+        # Build the header/clock/usage layouts once, matching the small-label and medium-header styles
+        if self._layouts is None:
+            base = self.get_pango_context().get_font_description()
+            small = base.copy()
+            small.set_absolute_size(12 * Pango.SCALE)
+            bold = base.copy()
+            bold.set_absolute_size(14 * Pango.SCALE)
+            bold.set_weight(Pango.Weight.BOLD)
+            layouts = []
+            for desc in (small, small, bold):
+                layout = self.create_pango_layout(None)
+                layout.set_font_description(desc)
+                layouts.append(layout)
+            self._layouts = layouts
+        return self._layouts
+
+    def _draw_text(self, cr, width, height):
+        header_layout, clock_layout, usage_layout = self._get_layouts()
+        
+        if hasattr(self, 'get_color'):
+            color = self.get_color()
+        else:
+            color = self.style_context.get_color()
+        cr.set_source_rgba(color.red, color.green, color.blue, color.alpha)
+        
+        # Thread name (top left)
+        if self.header_text:
+            header_layout.set_text(self.header_text, -1)
+            cr.move_to(TEXT_INSET, TEXT_INSET)
+            PangoCairo.show_layout(cr, header_layout)
+        
+        # Clock frequency (bottom left)
+        if self.clock_text and self.clock_visible:
+            clock_layout.set_text(self.clock_text, -1)
+            _, text_height = clock_layout.get_pixel_size()
+            cr.move_to(TEXT_INSET, height - TEXT_INSET - text_height)
+            PangoCairo.show_layout(cr, clock_layout)
+        
+        # Usage percentage (bottom right)
+        if self.usage_text:
+            usage_layout.set_text(self.usage_text, -1)
+            text_width, text_height = usage_layout.get_pixel_size()
+            cr.move_to(width - TEXT_INSET - text_width, height - TEXT_INSET - text_height)
+            PangoCairo.show_layout(cr, usage_layout)
+
     def update(self, usage):
-        self.usage_history.pop(0)
-        self.usage_history.append(usage)
-        self.queue_draw()
+        # A history holding one flat value looks the same after another equal sample, so skip the redraw
+        if usage == self.usage_history[-1]:
+            self._equal_run += 1
+        else:
+            self._equal_run = 1
+        self.usage_history.append(usage)  # The full deque drops the oldest sample
+        if self._equal_run < HISTORY_LENGTH:
+            self.queue_draw()
+
+    def _get_background(self, colors, width, height):
+        # Render the background and outline into an image surface, reused until size, scale or theme change
+        scale = self.get_scale_factor()
+        key = (width, height, scale, CPUGraphArea._theme_generation)
+        if key != self._background_key:
+            surface = cairo.ImageSurface(cairo.FORMAT_RGB24, width * scale, height * scale)
+            surface.set_device_scale(scale, scale)
+            bg_cr = cairo.Context(surface)
+            
+            # Background
+            bg_cr.set_source_rgb(*colors['background'])
+            bg_cr.paint()
+            
+            # Draw outline
+            bg_cr.set_source_rgb(*colors['outline'])
+            bg_cr.set_line_width(1)
+            bg_cr.rectangle(0.5, 0.5, width - 1, height - 1)
+            bg_cr.stroke()
+            
+            self._background = surface
+            self._background_key = key
+        return self._background
 
     def draw(self, area, cr, width, height):
         # Get theme-appropriate colors
-        colors = self.get_theme_colors()
+        colors = self._get_colors()
         
-        # Background
-        cr.set_source_rgb(*colors['background'])
+        # Background and outline, from the cached surface
+        cr.set_source_surface(self._get_background(colors, width, height), 0, 0)
         cr.paint()
 
-        # Draw outline
-        cr.set_source_rgb(*colors['outline'])
-        cr.set_line_width(1)
-        cr.rectangle(0.5, 0.5, width - 1, height - 1)
-        cr.stroke()
+        # Build the graph line once; its path is reused for both the tint and the stroke
+        if width != self._x_width:
+            step = width / (HISTORY_LENGTH - 1)
+            self._x_positions = [i * step for i in range(HISTORY_LENGTH)]
+            self._x_width = width
+        cr.new_path()
+        for x, usage in zip(self._x_positions, self.usage_history):
+            cr.line_to(x, height - usage * height)  # The first line_to starts the path
+        line_path = cr.copy_path()
 
-        # Draw tint underneath the graph line
-        cr.set_source_rgba(*colors['tint'])
-        
-        cr.move_to(0, height)
-        for i, usage in enumerate(self.usage_history):
-            x = i * (width / 59)
-            y = height - (usage * height)
-            cr.line_to(x, y)
+        # Draw tint underneath the graph line, closing the line along the bottom edge
         cr.line_to(width, height)
+        cr.line_to(0, height)
         cr.close_path()
+        cr.set_source_rgba(*colors['tint'])
         cr.fill()
 
         # Draw graph
+        cr.append_path(line_path)
         cr.set_source_rgb(*colors['graph'])
         cr.set_line_width(1.5)
+        cr.stroke()
 
-        cr.move_to(0, height - (self.usage_history[0] * height))
-        for i, usage in enumerate(self.usage_history):
-            x = i * (width / 59)
-            y = height - (usage * height)
-            cr.line_to(x, y)
-        cr.stroke()
\ No newline at end of file
+        # Text overlay for tiles that draw their own labels
+        if self.header_text is not None:
+            self._draw_text(cr, width, height)